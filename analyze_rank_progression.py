@@ -2,10 +2,182 @@
 """
 Analyze rank progression events in MTGA logs.
 """
-import json
+import os
 import re
+from itertools import repeat
 from pathlib import Path
 from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import orjson
+
+from src.parsers.log_io import (
+    find_matching_lines, last_line_end, load_index, save_index, should_parallelize,
+    split_line_ranges, usable_cpu_count
+)
+
+
+# Quoted key names that must appear in a line before it is worth parsing as JSON
+RANK_KEY_MARKERS = (
+    b'"constructedClass"',
+    b'"limitedClass"',
+    b'"rankUpdateDelta"',
+    b'"newRank"',
+    b'"oldRank"',
+)
+# Match room events only count when they mention one of the rank hints
+MATCH_ROOM_MARKER = b'"matchGameRoomStateChangedEvent"'
+MATCH_RANK_HINTS = (b'rank', b'tier', b'progression')
+# Any line worth parsing contains one of these
+RANK_LINE_PATTERN = re.compile(b'|'.join(re.escape(marker) for marker in RANK_KEY_MARKERS + (MATCH_ROOM_MARKER,)))
+
+# Constructed rank payloads are small flat objects, so the fields can be read
+# straight from the bytes. Anything this misses falls back to a full JSON parse.
+CONSTRUCTED_FAST_PATTERN = re.compile(
+    rb'"constructedClass":"(?P<cls>[^"\\]+)"'
+    rb'.*?"constructedLevel":(?P<lvl>\d+)'
+    rb'.*?"constructedStep":(?P<step>\d+)'
+    rb'.*?"constructedMatchesWon":(?P<won>\d+)'
+    rb'.*?"constructedMatchesLost":(?P<lost>\d+)'
+)
+TIMESTAMP_FAST_PATTERN = re.compile(rb'"timestamp":"?(\d+)')
+
+
+class RankEvent(NamedTuple):
+    """A rank-related event found in the log."""
+    line: int
+    type: str
+    timestamp: Optional[datetime]
+    rank_info: Dict[str, Any]
+    raw_line: bytes
+
+
+def to_datetime(ts_ms: Any) -> Optional[datetime]:
+    """Convert a millisecond timestamp from the log to a datetime."""
+    try:
+        return datetime.fromtimestamp(int(ts_ms) / 1000)
+    except (ValueError, OSError):
+        return None
+
+
+def shift_lines(events: List[RankEvent], line_offset: int) -> List[RankEvent]:
+    """Renumber events parsed from a later part of the log."""
+    return [event._replace(line=event.line + line_offset) for event in events]
+
+
+def scan_rank_events(log_file: Path, start: int, end: int) -> Tuple[List[RankEvent], int]:
+    """Collect rank-related events from a byte range of the log.
+    
+    Returns the events and the number of lines scanned. Line numbers are
+    counted from the start of the range.
+    """
+    rank_events = []
+    
+    # The regex runs over whole blocks, so lines without a marker never reach Python
+    candidates, line_count = find_matching_lines(log_file, RANK_LINE_PATTERN, start, end)
+    
+    for line_num, line in candidates:
+        line = line.strip()
+        
+        if not line.startswith(b'{'):
+            continue
+        
+        # Match room events only count when they mention one of the rank hints
+        if not any(marker in line for marker in RANK_KEY_MARKERS):
+            if not any(hint in line for hint in MATCH_RANK_HINTS):
+                continue
+        
+        # A single brace means a flat object, so a key match is a top-level key
+        elif line.count(b'{') == 1:
+            fast = CONSTRUCTED_FAST_PATTERN.search(line)
+            if fast:
+                ts_match = TIMESTAMP_FAST_PATTERN.search(line)
+                rank_info = {
+                    'format': 'Constructed',
+                    'class': fast['cls'].decode('utf-8'),
+                    'level': int(fast['lvl']),
+                    'step': int(fast['step']),
+                    'matches_won': int(fast['won']),
+                    'matches_lost': int(fast['lost']),
+                }
+                timestamp = to_datetime(ts_match[1]) if ts_match else None
+                rank_events.append(RankEvent(line_num, "RankInfo", timestamp, rank_info, line))
+                continue
+        
+        try:
+            data = orjson.loads(line)
+            
+            # Look for rank info in various formats
+            rank_info = None
+            event_type = "Unknown"
+            timestamp = None
+            
+            # Extract timestamp if available
+            if 'timestamp' in data:
+                timestamp = to_datetime(data['timestamp'])
+            
+            # Check for constructed rank details
+            if 'constructedClass' in data:
+                rank_info = {
+                    'format': 'Constructed',
+                    'class': data.get('constructedClass', ''),
+                    'level': data.get('constructedLevel', ''),
+                    'step': data.get('constructedStep', ''),
+                    'matches_won': data.get('constructedMatchesWon', ''),
+                    'matches_lost': data.get('constructedMatchesLost', ''),
+                }
+                event_type = "RankInfo"
+            
+            # Check for limited rank details  
+            elif 'limitedClass' in data:
+                rank_info = {
+                    'format': 'Limited',
+                    'class': data.get('limitedClass', ''),
+                    'level': data.get('limitedLevel', ''),
+                    'step': data.get('limitedStep', ''),
+                }
+                event_type = "RankInfo"
+            
+            # Check for rank update events
+            elif any(key in data for key in ['rankUpdateDelta', 'newRank', 'oldRank']):
+                rank_info = data
+                event_type = "RankUpdate"
+            
+            # Check for match completion with rank changes
+            elif 'matchGameRoomStateChangedEvent' in data:
+                room_info = data['matchGameRoomStateChangedEvent']
+                if any(key in str(room_info) for key in ['rank', 'tier', 'progression']):
+                    rank_info = room_info
+                    event_type = "MatchWithRank"
+            
+            if rank_info:
+                rank_events.append(RankEvent(line_num, event_type, timestamp, rank_info, line))
+        
+        except orjson.JSONDecodeError:
+            continue
+
+    return rank_events, line_count
+
+
+def collect_rank_events(log_file: Path, start: int, end: int) -> Tuple[List[RankEvent], int]:
+    """Scan a byte range, spreading large ranges across worker processes."""
+    if not should_parallelize(end - start):
+        return scan_rank_events(log_file, start, end)
+    
+    # Only pay for importing multiprocessing when a pool is actually used
+    from concurrent.futures import ProcessPoolExecutor
+    
+    rank_events = []
+    line_num = 0
+    ranges = split_line_ranges(log_file, usable_cpu_count(), start, end)
+    starts = [chunk_start for chunk_start, _ in ranges]
+    ends = [chunk_end for _, chunk_end in ranges]
+    with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+        for chunk_events, chunk_lines in pool.map(scan_rank_events, repeat(log_file), starts, ends):
+            # Chunk line numbers are local - shift them past the previous chunks
+            rank_events.extend(shift_lines(chunk_events, line_num))
+            line_num += chunk_lines
+    return rank_events, line_num
 
 
 def analyze_rank_progression():
@@ -15,90 +187,40 @@ def analyze_rank_progression():
     print("🎯 Analyzing Rank Progression...")
     print("=" * 60)
     
-    rank_events = []
-    line_num = 0
+    size = os.path.getsize(log_file)
+    # Only complete lines are cached - MTGA may still be writing the last one
+    complete_end = last_line_end(log_file, size)
     
-    with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-        for line in f:
-            line_num += 1
-            line = line.strip()
-            
-            if not line.startswith('{'):
-                continue
-                
-            try:
-                data = json.loads(line)
-                
-                # Look for rank info in various formats
-                rank_info = None
-                event_type = "Unknown"
-                timestamp = None
-                
-                # Extract timestamp if available
-                if 'timestamp' in data:
-                    try:
-                        ts_ms = int(data['timestamp'])
-                        timestamp = datetime.fromtimestamp(ts_ms / 1000)
-                    except (ValueError, OSError):
-                        pass
-                
-                # Check for constructed rank details
-                if 'constructedClass' in data:
-                    rank_info = {
-                        'format': 'Constructed',
-                        'class': data.get('constructedClass', ''),
-                        'level': data.get('constructedLevel', ''),
-                        'step': data.get('constructedStep', ''),
-                        'matches_won': data.get('constructedMatchesWon', ''),
-                        'matches_lost': data.get('constructedMatchesLost', ''),
-                    }
-                    event_type = "RankInfo"
-                
-                # Check for limited rank details  
-                elif 'limitedClass' in data:
-                    rank_info = {
-                        'format': 'Limited',
-                        'class': data.get('limitedClass', ''),
-                        'level': data.get('limitedLevel', ''),
-                        'step': data.get('limitedStep', ''),
-                    }
-                    event_type = "RankInfo"
-                
-                # Check for rank update events
-                elif any(key in data for key in ['rankUpdateDelta', 'newRank', 'oldRank']):
-                    rank_info = data
-                    event_type = "RankUpdate"
-                
-                # Check for match completion with rank changes
-                elif 'matchGameRoomStateChangedEvent' in data:
-                    room_info = data['matchGameRoomStateChangedEvent']
-                    if any(key in str(room_info) for key in ['rank', 'tier', 'progression']):
-                        rank_info = room_info
-                        event_type = "MatchWithRank"
-                
-                if rank_info:
-                    rank_events.append({
-                        'line': line_num,
-                        'type': event_type,
-                        'timestamp': timestamp,
-                        'rank_info': rank_info,
-                        'raw_data': data
-                    })
-            
-            except json.JSONDecodeError:
-                continue
+    # Player.log only grows, so reuse the previous scan and read just the new tail
+    index = load_index(log_file, 'rank')
+    if index:
+        rank_events = [RankEvent._make(event) for event in index['events']]
+        line_num, start = index['lines'], index['offset']
+    else:
+        rank_events, line_num, start = [], 0, 0
+    
+    if start < complete_end:
+        new_events, new_lines = collect_rank_events(log_file, start, complete_end)
+        rank_events.extend(shift_lines(new_events, line_num))
+        line_num += new_lines
+        # Plain tuples keep the cache independent of how this script was run
+        save_index(log_file, 'rank', complete_end, line_num, [tuple(event) for event in rank_events])
+    
+    if complete_end < size:
+        tail_events, _ = scan_rank_events(log_file, complete_end, size)
+        rank_events.extend(shift_lines(tail_events, line_num))
     
     print(f"Found {len(rank_events)} rank-related events:")
     print()
     
     # Display rank progression
     for i, event in enumerate(rank_events):
-        time_str = event['timestamp'].strftime('%H:%M:%S') if event['timestamp'] else 'Unknown'
+        time_str = event.timestamp.strftime('%H:%M:%S') if event.timestamp else 'Unknown'
         
-        print(f"🔸 Event {i+1} - Line {event['line']} [{time_str}] - {event['type']}")
+        print(f"🔸 Event {i+1} - Line {event.line} [{time_str}] - {event.type}")
         
-        if event['type'] == 'RankInfo':
-            info = event['rank_info']
+        if event.type == 'RankInfo':
+            info = event.rank_info
             if info.get('format') == 'Constructed':
                 tier = info.get('class', 'Unknown')
                 level = info.get('level', '?')
@@ -118,10 +240,10 @@ def analyze_rank_progression():
                 level = info.get('level', '?')
                 print(f"   📊 Limited: {tier} Tier {level}")
         
-        elif event['type'] == 'RankUpdate':
-            print(f"   📈 Rank Update: {list(event['rank_info'].keys())}")
+        elif event.type == 'RankUpdate':
+            print(f"   📈 Rank Update: {list(event.rank_info.keys())}")
         
-        elif event['type'] == 'MatchWithRank':
+        elif event.type == 'MatchWithRank':
             print(f"   🎮 Match with rank data")
         
         print()
@@ -132,15 +254,15 @@ def analyze_rank_progression():
         print("🎯 RANK PROGRESSION SUMMARY")
         print("=" * 60)
         
-        constructed_events = [e for e in rank_events if e['rank_info'].get('format') == 'Constructed']
+        constructed_events = [e for e in rank_events if e.rank_info.get('format') == 'Constructed']
         if constructed_events:
             print("Constructed Progression:")
             for event in constructed_events:
-                info = event['rank_info']
+                info = event.rank_info
                 tier = info.get('class', 'Unknown')
                 level = info.get('level', '?')
                 step = info.get('step', '?')
-                time_str = event['timestamp'].strftime('%H:%M:%S') if event['timestamp'] else 'Unknown'
+                time_str = event.timestamp.strftime('%H:%M:%S') if event.timestamp else 'Unknown'
                 print(f"  {time_str}: {tier} Tier {level} ({step}/6 pips)")
         
         print("\n🎉 This should show your Plat 3→4→3 progression!")
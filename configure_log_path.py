@@ -2,6 +2,7 @@
 """
 Simple configuration tool for MTGA log file path.
 """
+import os
 import sys
 from pathlib import Path
 
@@ -147,6 +148,8 @@ def test_configuration():
     try:
         # Try to read a few lines
         with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
             lines = [f.readline() for _ in range(5)]
         
         print(f"✅ Log file is readable: {log_file}")
@@ -2,9 +2,21 @@
 """
 Quick script to find rank progression events in MTGA logs.
 """
-import json
 import re
 from pathlib import Path
+from typing import NamedTuple
+
+from src.parsers.log_io import find_matching_lines
+
+
+# Single pass over raw bytes instead of N substring checks per line (matched case-insensitively)
+RANK_PATTERN = re.compile(rb'rank|tier|platinum|plat|gold|mythic|diamond|bronze')
+
+
+class RankLine(NamedTuple):
+    """A log line that mentions a rank keyword."""
+    line: int
+    content: str
 
 
 def find_rank_events():
@@ -14,28 +26,18 @@ def find_rank_events():
     print("🔍 Searching for rank events...")
     
     rank_events = []
-    line_num = 0
     
-    with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-        for line in f:
-            line_num += 1
-            line = line.strip()
-            
-            # Look for rank-related keywords
-            rank_keywords = ['rank', 'tier', 'platinum', 'plat', 'gold', 'mythic', 'diamond', 'bronze']
-            line_lower = line.lower()
-            
-            if any(keyword in line_lower for keyword in rank_keywords):
-                rank_events.append({
-                    'line': line_num,
-                    'content': line[:300] + '...' if len(line) > 300 else line
-                })
+    # The regex runs over whole blocks, so lines without a keyword never reach Python
+    matches, _ = find_matching_lines(log_file, RANK_PATTERN, ignore_case=True)
+    for line_num, raw in matches:
+        line = raw.strip().decode('utf-8', errors='ignore')
+        rank_events.append(RankLine(line_num, line[:300] + '...' if len(line) > 300 else line))
     
     print(f"Found {len(rank_events)} potential rank events:")
     print("=" * 80)
     
     for i, event in enumerate(rank_events[:20]):  # Show first 20
-        print(f"{i+1:2d}. Line {event['line']:4d}: {event['content']}")
+        print(f"{i+1:2d}. Line {event.line:4d}: {event.content}")
         print()
     
     if len(rank_events) > 20:
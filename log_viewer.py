@@ -2,14 +2,242 @@
 """
 Simple MTGA Log Viewer - Terminal-based log browser
 """
-import json
+import mmap
 import os
 import re
 import sys
 import time
+from array import array
+from bisect import bisect_right
 from datetime import datetime
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+
+import orjson
+
+from src.parsers.log_io import (
+    last_line_end, load_index, save_index, should_parallelize, split_line_ranges, usable_cpu_count
+)
+
+
+UNITY_TAG = b'[UnityCrossThreadLogger]'
+UNITY_EVENT_PATTERN = re.compile(r'==> (\w+)')
+# Keywords that make a plain text line worth keeping
+OTHER_KEYWORD_PATTERN = re.compile(rb'(?i)rank|match|game|event')
+# Keywords that flag a JSON event as possibly rank-related
+RANK_HINT_PATTERN = re.compile(rb'(?i)rank|tier|platinum|gold|mythic')
+
+
+# Stored in place of a timestamp when the event carries none
+NO_TIMESTAMP = -1
+
+# JSON raw data longer than this is shown truncated and not pretty-printed
+RAW_DETAIL_LIMIT = 5000
+
+# Erase the display and move the cursor to the top left
+CLEAR_SCREEN = '\x1b[2J\x1b[H'
+
+# Color coding for the event list, checked in order against the event type
+TYPE_COLORS = (
+    ('RANK', "🟡"),       # Yellow for potential rank events
+    ('GameState', "🟢"),  # Green for game state
+    ('Unity', "🔵"),      # Blue for Unity events
+    ('GRE', "🟣"),        # Purple for GRE events
+)
+
+# (line, type, timestamp in ms, content)
+EventRow = Tuple[int, str, int, str]
+
+
+def to_datetime(ts_ms: int) -> Optional[datetime]:
+    """Convert a stored millisecond timestamp to a datetime."""
+    if ts_ms == NO_TIMESTAMP:
+        return None
+    try:
+        return datetime.fromtimestamp(ts_ms / 1000)
+    except (ValueError, OSError, OverflowError):
+        return None
+
+
+@lru_cache(maxsize=None)
+def type_color(event_type: str) -> str:
+    """Color marker for an event type - there are only a handful of types, so cache them."""
+    for key, color in TYPE_COLORS:
+        if key in event_type:
+            return color
+    return ""
+
+
+def clear_screen() -> None:
+    """Clear the terminal and move the cursor home without spawning a shell."""
+    sys.stdout.write(CLEAR_SCREEN)
+    sys.stdout.flush()
+
+
+def preview_text(segment: bytes, limit: int = 200) -> str:
+    """Decode the start of a log line for display, adding '...' if it was cut short."""
+    if segment.isascii():
+        # One byte per character, so truncate first and decode only what is shown
+        text = segment[:limit].decode('ascii')
+        return text + '...' if len(segment) > limit else text
+    line = segment.decode('utf-8', errors='ignore')
+    return line[:limit] + '...' if len(line) > limit else line
+
+
+def _describe_gre_event(data: Dict[str, Any]) -> Tuple[str, str]:
+    """Event type and summary for Game Rules Engine messages."""
+    gre_messages = data['greToClientEvent'].get('greToClientMessages', [])
+    if not gre_messages:
+        return 'GREEvent', ""
+    
+    first_msg = gre_messages[0]
+    event_type = first_msg.get('type', 'GREEvent')
+    content = ""
+    
+    # Extract meaningful content
+    if event_type == 'GREMessageType_GameStateMessage':
+        game_state = first_msg.get('gameStateMessage', {})
+        game_info = game_state.get('gameInfo', {})
+        if game_info:
+            stage = game_info.get('stage', '')
+            match_state = game_info.get('matchState', '')
+            content = f"Game: {stage}, Match: {match_state}"
+        
+        # Look for player info
+        players = game_state.get('players', [])
+        if players:
+            life_info = []
+            for player in players[:2]:
+                seat = player.get('systemSeatNumber', '?')
+                life = player.get('lifeTotal', '?')
+                life_info.append(f"P{seat}:{life}")
+            if life_info:
+                content += f" | {' vs '.join(life_info)} life"
+    
+    elif event_type == 'GREMessageType_DieRollResultsResp':
+        die_rolls = first_msg.get('dieRollResultsResp', {}).get('playerDieRolls', [])
+        if die_rolls:
+            rolls = [str(roll.get('rollValue', '?')) for roll in die_rolls]
+            content = f"Die roll: {' vs '.join(rolls)}"
+    
+    return event_type, content
+
+
+def _describe_transaction(data: Dict[str, Any]) -> Tuple[str, str]:
+    """Event type and summary for system transactions."""
+    return 'Transaction', f"ID: {data.get('transactionId', 'Unknown')[:8]}..."
+
+
+def _describe_typed_event(data: Dict[str, Any]) -> Tuple[str, str]:
+    """Event type for events that name their own type."""
+    return data['type'], ""
+
+
+# Marker key -> describer, in priority order for events carrying several markers
+EVENT_DESCRIBERS = {
+    'greToClientEvent': _describe_gre_event,
+    'transactionId': _describe_transaction,
+    'type': _describe_typed_event,
+}
+
+
+class EventTable:
+    """Column-oriented storage for parsed log events.
+    
+    Keeping one list per field instead of one dict per event avoids the
+    per-event dict overhead on logs with hundreds of thousands of events.
+    Raw lines are not copied - only their byte span in the log file is kept
+    and the detail view reads them back on demand.
+    
+    The lowercased search text of every event is packed into one buffer,
+    each entry terminated by a NUL byte, so a filter is a series of C-level
+    find() calls rather than a Python loop over every event.
+    """
+    
+    def __init__(self):
+        self.lines = array('q')
+        self.types: List[str] = []
+        # Unix milliseconds - converted to datetime only when displayed
+        self.timestamps = array('q')
+        self.contents: List[str] = []
+        # Byte span of each event's line in the log file
+        self.raw_offsets = array('q')
+        self.raw_lengths = array('q')
+        self.search_blob = bytearray()
+        # Offset just past each event's entry in search_blob
+        self.search_ends = array('q')
+    
+    def __len__(self) -> int:
+        return len(self.lines)
+    
+    def append(self, row: EventRow, raw: bytes, raw_offset: int, raw_length: int) -> None:
+        """Add a single event row along with its raw line and where it lives in the file."""
+        line, event_type, timestamp, content = row
+        self.lines.append(line)
+        self.types.append(event_type)
+        self.timestamps.append(timestamp)
+        self.contents.append(content)
+        self.raw_offsets.append(raw_offset)
+        self.raw_lengths.append(raw_length)
+        if raw.isascii():
+            # Lowercasing ASCII bytes matches str.lower(), so skip the decode round trip
+            self.search_blob += f"{event_type} {content} ".lower().encode('utf-8')
+            self.search_blob += raw.lower()
+        else:
+            raw_text = raw.decode('utf-8', errors='ignore')
+            self.search_blob += f"{event_type} {content} {raw_text}".lower().encode('utf-8')
+        self.search_blob += b'\0'
+        self.search_ends.append(len(self.search_blob))
+    
+    def extend(self, other: 'EventTable', line_offset: int = 0) -> None:
+        """Append all events from another table, shifting their line numbers."""
+        self.lines.extend(line + line_offset for line in other.lines)
+        self.types.extend(other.types)
+        self.timestamps.extend(other.timestamps)
+        self.contents.extend(other.contents)
+        self.raw_offsets.extend(other.raw_offsets)
+        self.raw_lengths.extend(other.raw_lengths)
+        blob_offset = len(self.search_blob)
+        self.search_blob += other.search_blob
+        self.search_ends.extend(end + blob_offset for end in other.search_ends)
+    
+    def columns(self) -> Tuple[Any, ...]:
+        """Plain column data, used for caching the table on disk."""
+        return (self.lines, self.types, self.timestamps, self.contents,
+                self.raw_offsets, self.raw_lengths, self.search_blob, self.search_ends)
+    
+    @classmethod
+    def from_columns(cls, columns: Tuple[Any, ...]) -> 'EventTable':
+        """Rebuild a table from the output of columns()."""
+        table = cls()
+        (table.lines, table.types, table.timestamps, table.contents,
+         table.raw_offsets, table.raw_lengths, table.search_blob, table.search_ends) = columns
+        return table
+    
+    def search(self, term: str) -> List[int]:
+        """Indices of events whose type, content or raw data contain term (case-insensitive)."""
+        needle = term.lower().encode('utf-8')
+        blob = self.search_blob
+        ends = self.search_ends
+        matches = []
+        pos = blob.find(needle)
+        while pos != -1:
+            index = bisect_right(ends, pos)
+            matches.append(index)
+            # Skip the rest of this event - one hit is enough
+            pos = blob.find(needle, ends[index])
+        return matches
+    
+    def get(self, index: int) -> Dict[str, Any]:
+        """Materialise one event as a dict for display."""
+        return {
+            'line': self.lines[index],
+            'type': self.types[index],
+            'timestamp': to_datetime(self.timestamps[index]),
+            'content': self.contents[index]
+        }
 
 
 class MTGALogViewer:
@@ -18,8 +246,9 @@ class MTGALogViewer:
     def __init__(self, log_file: Path):
         self.log_file = log_file
         self.current_line = 0
-        self.filtered_lines = []
-        self.all_events = []
+        self.all_events = EventTable()
+        # Indices into all_events that match the current filter
+        self.filtered_lines = range(0)
         self.filter_term = ""
         
     def load_logs(self) -> None:
@@ -30,137 +259,170 @@ class MTGALogViewer:
             print(f"❌ Log file not found: {self.log_file}")
             return
         
-        events = []
+        try:
+            size = os.path.getsize(self.log_file)
+            # Only complete lines are cached - MTGA may still be writing the last one
+            complete_end = last_line_end(self.log_file, size)
+            
+            # Player.log only grows, so reuse the previous parse and read just the new tail
+            index = load_index(self.log_file, 'viewer')
+            if index:
+                events = EventTable.from_columns(index['events'])
+                line_num, start = index['lines'], index['offset']
+            else:
+                events, line_num, start = EventTable(), 0, 0
+            
+            if start < complete_end:
+                new_events, new_lines = self.parse_range(start, complete_end)
+                events.extend(new_events, line_num)
+                line_num += new_lines
+                save_index(self.log_file, 'viewer', complete_end, line_num, events.columns())
+            
+            if complete_end < size:
+                tail_events, tail_lines = self.scan_range(complete_end, size)
+                events.extend(tail_events, line_num)
+                line_num += tail_lines
+        
+        except Exception as e:
+            print(f"❌ Error loading logs: {e}")
+            return
+        
+        self.all_events = events
+        self.filtered_lines = range(len(events))
+        print(f"✅ Loaded {len(events)} events from {line_num} lines")
+    
+    def parse_range(self, start: int, end: int) -> Tuple[EventTable, int]:
+        """Parse a byte range, spreading large ranges across worker processes."""
+        if not should_parallelize(end - start):
+            return self.scan_range(start, end)
+        
+        # Only pay for importing multiprocessing when a pool is actually used
+        from concurrent.futures import ProcessPoolExecutor
+        
+        events = EventTable()
+        line_num = 0
+        ranges = split_line_ranges(self.log_file, usable_cpu_count(), start, end)
+        starts = [chunk_start for chunk_start, _ in ranges]
+        ends = [chunk_end for _, chunk_end in ranges]
+        with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+            for chunk_events, chunk_lines in pool.map(_scan_chunk, repeat(self.log_file), starts, ends):
+                # Chunk line numbers are local - shift them past the previous chunks
+                events.extend(chunk_events, line_num)
+                line_num += chunk_lines
+        return events, line_num
+    
+    def scan_range(self, start: int, end: int) -> Tuple[EventTable, int]:
+        """Parse the lines in a byte range of the log file.
+        
+        Returns the events found and the number of lines scanned. Line numbers
+        are counted from the start of the range.
+        """
+        events = EventTable()
         line_num = 0
         
-        try:
-            with open(self.log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                for line in f:
+        with open(self.log_file, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            # Single sequential pass - let the kernel read ahead aggressively
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(f.fileno(), start, end - start, os.POSIX_FADV_SEQUENTIAL)
+            # mmap refuses zero-length files
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+            if size and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+                mm.madvise(mmap.MADV_WILLNEED)
+            try:
+                pos = start
+                while pos < end:
+                    nl = mm.find(b'\n', pos, end)
+                    if nl == -1:
+                        nl = end
+                    line_start = pos
+                    segment = mm[pos:nl].strip()
+                    pos = nl + 1
                     line_num += 1
-                    line = line.strip()
                     
-                    if not line:
+                    if not segment:
                         continue
                     
                     # Try to parse JSON lines
-                    if line.startswith('{'):
+                    if segment.startswith(b'{'):
                         try:
-                            data = json.loads(line)
-                            event = self.parse_event(data, line_num)
+                            data = orjson.loads(segment)
+                            event = self.parse_event(data, line_num, segment)
                             if event:
-                                events.append(event)
-                        except json.JSONDecodeError:
+                                events.append(event, segment, line_start, nl - line_start)
+                        except orjson.JSONDecodeError:
                             # Keep as raw text
-                            events.append({
-                                'line': line_num,
-                                'type': 'Raw',
-                                'timestamp': datetime.now(),
-                                'content': line[:200] + '...' if len(line) > 200 else line,
-                                'raw_data': line
-                            })
+                            events.append((
+                                line_num, 'Raw', NO_TIMESTAMP, preview_text(segment)
+                            ), segment, line_start, nl - line_start)
                     
                     # Parse Unity logger lines
-                    elif '[UnityCrossThreadLogger]' in line:
-                        event = self.parse_unity_log(line, line_num)
+                    elif UNITY_TAG in segment:
+                        event = self.parse_unity_log(segment.decode('utf-8', errors='ignore'), line_num)
                         if event:
-                            events.append(event)
+                            events.append(event, segment, line_start, nl - line_start)
                     
                     # Other log lines
-                    elif any(keyword in line.lower() for keyword in ['rank', 'match', 'game', 'event']):
-                        events.append({
-                            'line': line_num,
-                            'type': 'Other', 
-                            'timestamp': datetime.now(),
-                            'content': line[:200] + '...' if len(line) > 200 else line,
-                            'raw_data': line
-                        })
-        
-        except Exception as e:
-            print(f"❌ Error loading logs: {e}")
-            return
+                    elif OTHER_KEYWORD_PATTERN.search(segment):
+                        events.append((
+                            line_num, 'Other', NO_TIMESTAMP, preview_text(segment)
+                        ), segment, line_start, nl - line_start)
+            finally:
+                if size:
+                    mm.close()
         
-        self.all_events = events
-        self.filtered_lines = events.copy()
-        print(f"✅ Loaded {len(events)} events from {line_num} lines")
+        return events, line_num
     
-    def parse_event(self, data: Dict[str, Any], line_num: int) -> Optional[Dict[str, Any]]:
-        """Parse a JSON event from the logs."""
+    def parse_event(self, data: Dict[str, Any], line_num: int, raw_bytes: bytes) -> Optional[EventRow]:
+        """Parse a JSON event from the logs.
+        
+        raw_bytes is the original log line, used for keyword checks so the
+        parsed dict never has to be serialised again.
+        """
         event_type = 'Unknown'
-        timestamp = datetime.now()
+        timestamp = NO_TIMESTAMP
         content = ""
         
         # Extract timestamp
         if 'timestamp' in data:
             try:
                 ts_ms = int(data['timestamp'])
-                timestamp = datetime.fromtimestamp(ts_ms / 1000)
-            except (ValueError, OSError):
+                # Must fit the int64 timestamp column
+                if 0 <= ts_ms < 2 ** 63:
+                    timestamp = ts_ms
+            except ValueError:
                 pass
         
-        # Determine event type and content
-        if 'greToClientEvent' in data:
-            gre_messages = data['greToClientEvent'].get('greToClientMessages', [])
-            if gre_messages:
-                first_msg = gre_messages[0]
-                event_type = first_msg.get('type', 'GREEvent')
-                
-                # Extract meaningful content
-                if event_type == 'GREMessageType_GameStateMessage':
-                    game_state = first_msg.get('gameStateMessage', {})
-                    game_info = game_state.get('gameInfo', {})
-                    if game_info:
-                        stage = game_info.get('stage', '')
-                        match_state = game_info.get('matchState', '')
-                        content = f"Game: {stage}, Match: {match_state}"
-                    
-                    # Look for player info
-                    players = game_state.get('players', [])
-                    if players:
-                        life_info = []
-                        for player in players[:2]:
-                            seat = player.get('systemSeatNumber', '?')
-                            life = player.get('lifeTotal', '?')
-                            life_info.append(f"P{seat}:{life}")
-                        if life_info:
-                            content += f" | {' vs '.join(life_info)} life"
-                
-                elif event_type == 'GREMessageType_DieRollResultsResp':
-                    die_rolls = first_msg.get('dieRollResultsResp', {}).get('playerDieRolls', [])
-                    if die_rolls:
-                        rolls = [str(roll.get('rollValue', '?')) for roll in die_rolls]
-                        content = f"Die roll: {' vs '.join(rolls)}"
+        # Determine event type and content from whichever marker key the event carries
+        keys = data.keys() & EVENT_DESCRIBERS.keys()
+        if keys:
+            if len(keys) > 1:
+                # EVENT_DESCRIBERS is ordered by priority
+                key = next(key for key in EVENT_DESCRIBERS if key in keys)
             else:
-                event_type = 'GREEvent'
-        
-        elif 'transactionId' in data:
-            event_type = 'Transaction'
-            content = f"ID: {data.get('transactionId', 'Unknown')[:8]}..."
-        
-        # Look for other event types
-        elif 'type' in data:
-            event_type = data['type']
+                key = next(iter(keys))
+            event_type, content = EVENT_DESCRIBERS[key](data)
         
         # Check for rank-related content
-        content_lower = json.dumps(data).lower()
-        if any(term in content_lower for term in ['rank', 'tier', 'platinum', 'gold', 'mythic']):
+        if RANK_HINT_PATTERN.search(raw_bytes):
             event_type += ' [RANK?]'
         
-        return {
-            'line': line_num,
-            'type': event_type,
-            'timestamp': timestamp,
-            'content': content or f"Data keys: {list(data.keys())[:5]}",
-            'raw_data': json.dumps(data, indent=2) if len(str(data)) < 5000 else json.dumps(data)[:5000] + '...'
-        }
+        return (
+            line_num,
+            event_type,
+            timestamp,
+            content or f"Data keys: {list(data.keys())[:5]}"
+        )
     
-    def parse_unity_log(self, line: str, line_num: int) -> Optional[Dict[str, Any]]:
+    def parse_unity_log(self, line: str, line_num: int) -> Optional[EventRow]:
         """Parse Unity logger line."""
         event_type = 'UnityLog'
         content = line
         
         # Extract event type from Unity format
         if '==>' in line:
-            event_match = re.search(r'==> (\w+)', line)
+            event_match = UNITY_EVENT_PATTERN.search(line)
             if event_match:
                 event_type = f"Unity_{event_match.group(1)}"
         
@@ -169,86 +431,91 @@ class MTGALogViewer:
         if json_start != -1:
             try:
                 json_str = line[json_start:]
-                json_data = json.loads(json_str)
+                json_data = orjson.loads(json_str)
                 content = f"Unity event with data: {list(json_data.keys())[:3]}"
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 pass
         
-        return {
-            'line': line_num,
-            'type': event_type,
-            'timestamp': datetime.now(),
-            'content': content[:200] + '...' if len(content) > 200 else content,
-            'raw_data': line
-        }
+        return (
+            line_num,
+            event_type,
+            NO_TIMESTAMP,
+            content[:200] + '...' if len(content) > 200 else content
+        )
     
     def display_events(self, start: int = 0, count: int = 20) -> None:
         """Display events in terminal."""
-        os.system('clear' if os.name == 'posix' else 'cls')
-        
-        print("=" * 80)
-        print("🎯 MTGA LOG VIEWER")
-        print(f"📁 File: {self.log_file}")
-        print(f"📊 Events: {len(self.filtered_lines)} / {len(self.all_events)}")
+        # Build the whole page and write it at once rather than a print per line
+        out = [CLEAR_SCREEN + "=" * 80]
+        out.append("🎯 MTGA LOG VIEWER")
+        out.append(f"📁 File: {self.log_file}")
+        out.append(f"📊 Events: {len(self.filtered_lines)} / {len(self.all_events)}")
         if self.filter_term:
-            print(f"🔍 Filter: '{self.filter_term}'")
-        print("=" * 80)
+            out.append(f"🔍 Filter: '{self.filter_term}'")
+        out.append("=" * 80)
         
         end = min(start + count, len(self.filtered_lines))
         
         for i in range(start, end):
-            event = self.filtered_lines[i]
-            timestamp = event['timestamp'].strftime('%H:%M:%S')
-            
-            # Color coding
-            color = ""
-            if 'RANK' in event['type']:
-                color = "🟡"  # Yellow for potential rank events
-            elif 'GameState' in event['type']:
-                color = "🟢"  # Green for game state
-            elif 'Unity' in event['type']:
-                color = "🔵"  # Blue for Unity events
-            elif 'GRE' in event['type']:
-                color = "🟣"  # Purple for GRE events
-            
-            print(f"{color} {i+1:3d} [{timestamp}] {event['type'][:20]:20} | {event['content']}")
+            event = self.all_events.get(self.filtered_lines[i])
+            timestamp = event['timestamp'].strftime('%H:%M:%S') if event['timestamp'] else '--:--:--'
+            color = type_color(event['type'])
+            out.append(f"{color} {i+1:3d} [{timestamp}] {event['type'][:20]:20} | {event['content']}")
         
-        print("=" * 80)
-        print(f"📍 Showing {start+1}-{end} of {len(self.filtered_lines)} events")
-        print("Commands: [n]ext, [p]rev, [f]ilter, [d]etail, [q]uit, [r]ank")
+        out.append("=" * 80)
+        out.append(f"📍 Showing {start+1}-{end} of {len(self.filtered_lines)} events")
+        out.append("Commands: [n]ext, [p]rev, [f]ilter, [d]etail, [q]uit, [r]ank")
+        sys.stdout.write("\n".join(out) + "\n")
+        sys.stdout.flush()
     
     def filter_events(self, term: str) -> None:
         """Filter events by search term."""
         if not term:
-            self.filtered_lines = self.all_events.copy()
+            self.filtered_lines = range(len(self.all_events))
             self.filter_term = ""
             return
         
         self.filter_term = term.lower()
-        self.filtered_lines = []
+        # Search in type, content, and raw data
+        self.filtered_lines = self.all_events.search(term)
+    
+    def read_raw_data(self, event_index: int) -> str:
+        """Read an event's line back from the log, pretty-printing JSON."""
+        events = self.all_events
+        try:
+            with open(self.log_file, 'rb') as f:
+                f.seek(events.raw_offsets[event_index])
+                raw = f.read(events.raw_lengths[event_index]).strip()
+        except OSError as e:
+            return f"Unable to read raw data: {e}"
+        
+        text = raw.decode('utf-8', errors='ignore')
+        if not raw.startswith(b'{'):
+            return text
         
-        for event in self.all_events:
-            # Search in type, content, and raw data
-            search_text = f"{event['type']} {event['content']} {event.get('raw_data', '')}".lower()
-            if term.lower() in search_text:
-                self.filtered_lines.append(event)
+        if len(raw) < RAW_DETAIL_LIMIT:
+            try:
+                return orjson.dumps(orjson.loads(raw), option=orjson.OPT_INDENT_2).decode('utf-8')
+            except orjson.JSONDecodeError:
+                pass
+        return text if len(text) < RAW_DETAIL_LIMIT else text[:RAW_DETAIL_LIMIT] + '...'
     
     def show_detail(self, index: int) -> None:
         """Show detailed view of an event."""
         if 0 <= index < len(self.filtered_lines):
-            event = self.filtered_lines[index]
+            event = self.all_events.get(self.filtered_lines[index])
             
-            os.system('clear' if os.name == 'posix' else 'cls')
+            clear_screen()
             print("=" * 80)
             print(f"🔍 EVENT DETAIL - #{index + 1}")
             print("=" * 80)
             print(f"Line: {event['line']}")
             print(f"Type: {event['type']}")
-            print(f"Time: {event['timestamp']}")
+            print(f"Time: {event['timestamp'] or 'Unknown'}")
             print(f"Content: {event['content']}")
             print("-" * 80)
             print("Raw Data:")
-            print(event.get('raw_data', 'No raw data'))
+            print(self.read_raw_data(self.filtered_lines[index]))
             print("=" * 80)
             input("Press Enter to continue...")
     
@@ -317,6 +584,11 @@ class MTGALogViewer:
         print("\n👋 Thanks for using MTGA Log Viewer!")
 
 
+def _scan_chunk(log_file: Path, start: int, end: int) -> Tuple[EventTable, int]:
+    """Worker entry point for parsing one byte range in a separate process."""
+    return MTGALogViewer(log_file).scan_range(start, end)
+
+
 def main():
     """Main entry point."""
     # Try command-line argument first
@@ -359,6 +631,11 @@ def main():
         print("3. Place logs in mtga-test-logs/Player.log for testing")
         sys.exit(1)
     
+    # Windows consoles only honour ANSI escapes once VT processing is switched on,
+    # which running any command through the console does as a side effect
+    if os.name == 'nt':
+        os.system('')
+    
     viewer = MTGALogViewer(log_file)
     viewer.run()
 
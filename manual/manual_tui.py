@@ -4,26 +4,24 @@ MTGA Mythic TUI Session Tracker (Manual) - Standalone Version
 Complete manual rank tracking with no external dependencies.
 """
 
-import json
 import argparse
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, List, Union, Tuple
-from enum import Enum
-import asyncio
-import os
-from dataclasses import dataclass, asdict
+from typing import Optional, Tuple
 
 from textual.app import App, ComposeResult
-from textual.widgets import Static, Input, Button, Label, Footer, Select, TextArea, DataTable
+from textual.widgets import Static, Input, Button, Label, Footer, Select
 from textual.containers import Container, Horizontal, Vertical
-from textual.screen import Screen, ModalScreen
-from textual.reactive import reactive
+from textual.screen import ModalScreen
 from textual.binding import Binding
-from textual.message import Message
 
 # Import models from our new modules
-from models import FormatType, RankTier, ManualRank, CompletedSession, SessionStats, AppData
+from models import (
+    FormatType, RankTier, ManualRank, SessionStats, AppData,
+    TIER_ORDER_NO_MYTHIC, TIER_INDEX, CONSTRUCTED_FORMATS, add_tiers
+)
 from storage import StateManager
 
 # === MODELS === (NOW IMPORTED FROM models/ PACKAGE)
@@ -33,11 +31,159 @@ from storage import StateManager
 # === STATE PERSISTENCE === (NOW IMPORTED FROM storage/ PACKAGE)
 # Previously contained StateManager class - moved to storage/state_manager.py
 
+# === RANK BAR RENDERING ===
+
+# Tier rows from Mythic at the top down to Bronze
+_TIERS_TOP_DOWN = tuple(reversed(RankTier))
+
+_TIER_COLORS = {
+    RankTier.BRONZE: "rgb(139,69,19)",    # Bronze
+    RankTier.SILVER: "rgb(192,192,192)",  # Silver
+    RankTier.GOLD: "rgb(255,215,0)",      # Gold
+    RankTier.PLATINUM: "rgb(0,206,209)",  # Cyan/Teal
+    RankTier.DIAMOND: "rgb(138,43,226)",  # Royal purple
+    RankTier.MYTHIC: "rgb(255,140,0)"     # True planeswalker orange
+}
+
+# Markup for one pip of a division bar
+_CURRENT_PIP = {tier: f"[{color}][██][/{color}]" for tier, color in _TIER_COLORS.items()}  # Solid, tier colored
+_HIGHEST_PIP = "[rgb(128,128,128)][░░][/rgb(128,128,128)]"  # Reached earlier this season - light gray
+_EMPTY_PIP = "[  ]"
+
+# Fixed start of each tier row: a collapsed tier, a division, and the division the player is in
+_COLLAPSED_ROW = {tier: f"{tier.value:<9}   [{color}][██████████████████████][/{color}]"
+                  for tier, color in _TIER_COLORS.items()}
+_DIVISION_LABEL = {(tier, div): f"{tier.value:<9} {div} " for tier in RankTier for div in range(1, 5)}
+_CURRENT_DIVISION_LABEL = {
+    (tier, div): f"[black on {color}]{tier.value:<9}[/black on {color}] [black on {color}]{div}[/black on {color}] "
+    for tier, color in _TIER_COLORS.items() for div in range(1, 5)
+}
+
+
+def _tier_color(tier: RankTier) -> str:
+    """Get the color for a specific tier."""
+    return _TIER_COLORS.get(tier, "white")
+
+
+def _is_position_filled(tier: RankTier, division: int, rank: ManualRank) -> bool:
+    """Check if a rank position is completed by rank."""
+    # Don't try to fill mythic bars - mythic doesn't have bars
+    if tier == RankTier.MYTHIC:
+        return False
+    
+    # If the rank is mythic, all non-mythic positions are filled
+    if rank.is_mythic():
+        return True
+    
+    rank_tier_idx = TIER_INDEX[rank.tier]
+    check_tier_idx = TIER_INDEX[tier]
+    
+    # Lower tiers are filled, and lower divisions of the same tier
+    return check_tier_idx < rank_tier_idx or (check_tier_idx == rank_tier_idx and division > rank.division)
+
+
+def _bar_display(tier: RankTier, division: int, current_rank: ManualRank,
+                 highest_rank: Optional[ManualRank], max_pips: int) -> str:
+    """Create bar display showing current progress vs highest achieved."""
+    # Get current progress for this tier/division
+    current_pips = 0
+    if tier == current_rank.tier and division == current_rank.division:
+        current_pips = current_rank.pips
+    elif _is_position_filled(tier, division, current_rank):
+        current_pips = max_pips  # Fully completed
+    
+    # Get highest achieved progress for this tier/division
+    highest_pips = 0
+    if highest_rank:
+        if tier == highest_rank.tier and division == highest_rank.division:
+            highest_pips = highest_rank.pips
+        elif _is_position_filled(tier, division, highest_rank):
+            highest_pips = max_pips  # Fully completed by highest rank
+    
+    # Create visual representation: current [██] vs highest [░░] vs empty [  ]
+    current_count = min(current_pips, max_pips)
+    highest_count = max(0, min(highest_pips, max_pips) - current_count)
+    empty_count = max_pips - current_count - highest_count
+    return _CURRENT_PIP[tier] * current_count + _HIGHEST_PIP * highest_count + _EMPTY_PIP * empty_count
+
+
+@lru_cache(maxsize=64)
+def _render_rank_bars(current_rank: ManualRank, highest_rank: Optional[ManualRank], max_pips: int,
+                      hidden_tiers: Tuple[RankTier, ...], collapsed_tiers: Tuple[RankTier, ...],
+                      goal: Optional[Tuple[RankTier, Optional[int]]]) -> str:
+    """Render the tier rows of the rank progress panel.
+    
+    Ranks are immutable, so the rows only change when one of the arguments does.
+    """
+    lines = []
+    for tier in _TIERS_TOP_DOWN:
+        # Skip hidden tiers entirely
+        if tier in hidden_tiers:
+            continue
+            
+        if tier == RankTier.MYTHIC:
+            # Show mythic with just percentage/rank, no bars
+            if current_rank.tier == RankTier.MYTHIC:
+                if current_rank.mythic_rank:
+                    mythic_display = f"#{current_rank.mythic_rank}"
+                else:
+                    mythic_display = f"{current_rank.mythic_percentage:.1f}%" if current_rank.mythic_percentage else "0%"
+                
+                # Highlight mythic if it's current rank
+                tier_color = _tier_color(RankTier.MYTHIC)
+                mythic_text = f"[black on {tier_color}]Mythic   [/black on {tier_color}]"
+                lines.append(f"{mythic_text} {mythic_display}")
+            else:
+                lines.append("Mythic    --")
+        elif tier in collapsed_tiers:
+            lines.append(_COLLAPSED_ROW[tier])
+        else:
+            # Show all 4 divisions for this tier
+            for div in range(1, 5):
+                bars = _bar_display(tier, div, current_rank, highest_rank, max_pips)
+                goal_marker = " ←GOAL" if goal == (tier, div) else ""
+                
+                # Highlight current position with tier-colored background
+                if tier == current_rank.tier and div == current_rank.division:
+                    # Add boss fight indicator to current tier line
+                    boss_marker = " ⚔️ [bold red]BOSS TIER![/bold red]" if current_rank.is_boss_fight() else ""
+                    lines.append(f"{_CURRENT_DIVISION_LABEL[tier, div]}{bars}{goal_marker}{boss_marker}")
+                else:
+                    lines.append(f"{_DIVISION_LABEL[tier, div]}{bars}{goal_marker}")
+    
+    return "\n".join(lines)
+
+
+# === SESSION SECTION FORMATTING ===
+
+# L10 strip marker for each game result
+_RESULT_EMOJI = {
+    'W': '🟢',  # Green circle for win
+    'L': '🔴',  # Red circle for loss
+}
+
+
+def _format_minutes(seconds: int) -> str:
+    """Format a timer as minutes and seconds, e.g. 07m 05s (minutes may exceed 59)."""
+    return f"{seconds // 60:02d}m {seconds % 60:02d}s"
+
+
+def _format_duration(seconds: int) -> str:
+    """Format a session duration, adding hours once it passes an hour."""
+    if seconds >= 3600:
+        return f"{seconds // 3600:02d}h {_format_minutes(seconds % 3600)}"
+    return _format_minutes(seconds)
+
+
 # === TEXTUAL WIDGETS ===
 
 class EditableText(Static):
     """Custom inline editable text widget."""
     
+    BINDINGS = [
+        Binding("escape", "cancel_edit", "Cancel Edit", show=False),
+    ]
+    
     def __init__(self, initial_value: str = "", **kwargs):
         super().__init__(**kwargs)
         self.initial_value = initial_value
@@ -75,10 +221,12 @@ class EditableText(Static):
         if event.input == self._input and self.is_editing:
             self.exit_edit_mode()
     
-    def on_key(self, event) -> None:
-        if event.key == "escape" and self.is_editing:
-            self._input.value = str(self._label.renderable)  # Reset
-            self.exit_edit_mode()
+    def action_cancel_edit(self) -> None:
+        """Discard the edit and switch back to display mode."""
+        if not self.is_editing:
+            return
+        self._input.value = str(self._label.renderable)  # Reset
+        self.exit_edit_mode()
     
     @property
     def value(self) -> str:
@@ -91,6 +239,12 @@ class TopPanel(Static):
     def __init__(self, app_data: AppData):
         super().__init__()
         self.app_data = app_data
+        # Column widgets, looked up once on mount
+        self._season_widget = None
+        self._format_widget = None
+        self._bars_widget = None
+        self._rank_widget = None
+        self._last_columns = (None, None, None, None)  # Text last pushed to each column
     
     def compose(self) -> ComposeResult:
         with Horizontal(classes="top-panel-layout"):
@@ -108,10 +262,19 @@ class TopPanel(Static):
     
     def on_mount(self) -> None:
         """Update display when mounted."""
+        self._season_widget = self.query_one(".top-season", Static)
+        self._format_widget = self.query_one(".top-format", Static)
+        self._bars_widget = self.query_one(".top-bars", Static)
+        self._rank_widget = self.query_one(".top-rank", Static)
         self.update_display()
     
-    def update_display(self):
+    def update_display(self, now: Optional[datetime] = None):
         """Update top panel display."""
+        if self._season_widget is None:
+            return  # Not mounted yet
+        if now is None:
+            now = datetime.now()
+        
         current_rank = self.app_data.get_current_rank()
         format_name = self.app_data.current_format.value.upper()
         stats = self.app_data.stats
@@ -120,7 +283,7 @@ class TopPanel(Static):
         season_text = "--"
         season_date = ""
         if stats.season_end_date:
-            time_left = stats.season_end_date - datetime.now()
+            time_left = stats.season_end_date - now
             if time_left.total_seconds() > 0:
                 days = time_left.days
                 hours = time_left.seconds // 3600
@@ -158,21 +321,13 @@ class TopPanel(Static):
         
         rank_content = f"📍 {rank_text}"
         
-        # Update the four columns
-        try:
-            season_widget = self.query_one(".top-season", Static)
-            season_widget.update(season_content)
-            
-            format_widget = self.query_one(".top-format", Static)
-            format_widget.update(format_content)
-            
-            bars_widget = self.query_one(".top-bars", Static)
-            bars_widget.update(bars_content)
-            
-            rank_widget = self.query_one(".top-rank", Static)
-            rank_widget.update(rank_content)
-        except:
-            pass  # Ignore if widgets not found during startup
+        # Update the four columns, skipping any whose text hasn't changed
+        columns = (season_content, format_content, bars_content, rank_content)
+        widgets = (self._season_widget, self._format_widget, self._bars_widget, self._rank_widget)
+        for widget, content, last in zip(widgets, columns, self._last_columns):
+            if content != last:
+                widget.update(content)
+        self._last_columns = columns
 
 class RankProgressPanel(Static):
     """Left panel showing interactive rank progression."""
@@ -180,42 +335,79 @@ class RankProgressPanel(Static):
     def __init__(self, app_data: AppData):
         super().__init__()
         self.app_data = app_data
+        # Widgets that change, looked up once on mount
+        self._header = None
+        self._mythic_widgets = ()
+        self._rank_bars = None
+    
+    @staticmethod
+    def content_key(app_data: AppData) -> tuple:
+        """Everything the panel shows, so it's only rebuilt when one of these changes."""
+        stats = app_data.stats
+        highest_rank = stats.season_highest_rank
+        if isinstance(highest_rank, dict):
+            highest_rank = tuple(highest_rank.items())  # Converted on the next compose
+        return (
+            app_data.current_format,
+            app_data.get_current_rank(),
+            app_data.show_mythic_progress,
+            tuple(app_data.hidden_tiers),
+            tuple(app_data.collapsed_tiers),
+            highest_rank,
+            stats.session_goal_tier,
+            stats.session_goal_division,
+        )
     
     def compose(self) -> ComposeResult:
-        current_rank = self.app_data.get_current_rank()
-        format_name = self.app_data.current_format.value
-        
         with Vertical():
-            yield Static(f"─ [{format_name.upper()}] Rank Progress ─", classes="panel-header")
+            yield Static(classes="panel-header")
             
-            # Show mythic display if mythic is achieved and enabled
-            if current_rank.tier == RankTier.MYTHIC and self.app_data.show_mythic_progress:
-                yield Static("")  # Empty line for spacing
-                yield self._create_mythic_display(current_rank)
-                yield Static("─" * 30, classes="separator")
-            else:
-                yield Static("─" * 30, classes="separator")
+            # Mythic display, only shown once mythic is achieved and enabled
+            yield Static("", classes="mythic-spacer")  # Empty line for spacing
+            yield Static(classes="mythic-display")
+            yield Static("─" * 30, classes="separator")
             
             # Always show rank bars
-            yield self._create_rank_bars()
+            yield Static(classes="rank-bars")
             
             yield Static("─" * 30, classes="separator")
     
-    def _create_mythic_display(self, rank: ManualRank) -> Static:
-        """Create Mythic achievement display."""
+    def on_mount(self) -> None:
+        """Look up the widgets that change and fill them in."""
+        self._header = self.query_one(".panel-header", Static)
+        self._mythic_widgets = (self.query_one(".mythic-spacer", Static), self.query_one(".mythic-display", Static))
+        self._rank_bars = self.query_one(".rank-bars", Static)
+        self.update_display()
+    
+    def update_display(self) -> None:
+        """Update the panel in place from the current data."""
+        if self._rank_bars is None:
+            return  # Not mounted yet
+        current_rank = self.app_data.get_current_rank()
+        format_name = self.app_data.current_format.value
+        self._header.update(f"─ [{format_name.upper()}] Rank Progress ─")
+        
+        show_mythic = current_rank.tier == RankTier.MYTHIC and self.app_data.show_mythic_progress
+        for widget in self._mythic_widgets:
+            widget.display = show_mythic
+        if show_mythic:
+            self._mythic_widgets[1].update(self._mythic_display_content(current_rank))
+        
+        self._rank_bars.update(self._rank_bars_content(current_rank))
+    
+    def _mythic_display_content(self, rank: ManualRank) -> str:
+        """Build the Mythic achievement display."""
         if rank.mythic_rank:
             current_text = f"Current: #{rank.mythic_rank}"
         else:
             current_text = f"Current: {rank.mythic_percentage:.1f}%" if rank.mythic_percentage else "Current: --"
         
-        return Static(f"""🏆 [rgb(255,140,0)]MYTHIC ACHIEVED![/rgb(255,140,0)] 🏆
+        return f"""🏆 [rgb(255,140,0)]MYTHIC ACHIEVED![/rgb(255,140,0)] 🏆
 
-{current_text}""", classes="mythic-display")
+{current_text}"""
     
-    def _create_rank_bars(self) -> Static:
-        """Create rank progression bars as a single text widget."""
-        current_rank = self.app_data.get_current_rank()
-        
+    def _rank_bars_content(self, current_rank: ManualRank) -> str:
+        """Build the rank progression bars as a single block of text."""
         # Build text display
         lines = []
         
@@ -226,6 +418,7 @@ class RankProgressPanel(Static):
             lines.append("")  # Empty line for spacing
         
         # Highest achieved rank indicator
+        highest_rank = None
         if self.app_data.stats.season_highest_rank:
             highest_rank = self.app_data.stats.season_highest_rank
             
@@ -262,177 +455,20 @@ class RankProgressPanel(Static):
             lines.append("")  # Empty line for spacing
         
         # All rank tiers from Mythic down to Bronze
-        tier_order = list(RankTier)
-        tier_order.reverse()  # Mythic at top
-        
-        for tier in tier_order:
-            # Skip hidden tiers entirely
-            if tier in self.app_data.hidden_tiers:
-                continue
-                
-            if tier == RankTier.MYTHIC:
-                # Show mythic with just percentage/rank, no bars
-                if current_rank.tier == RankTier.MYTHIC:
-                    if current_rank.mythic_rank:
-                        mythic_display = f"#{current_rank.mythic_rank}"
-                    else:
-                        mythic_display = f"{current_rank.mythic_percentage:.1f}%" if current_rank.mythic_percentage else "0%"
-                    
-                    # Highlight mythic if it's current rank
-                    tier_color = self._get_tier_color(RankTier.MYTHIC)
-                    mythic_text = f"[black on {tier_color}]Mythic   [/black on {tier_color}]"
-                    lines.append(f"{mythic_text} {mythic_display}")
-                else:
-                    lines.append("Mythic    --")
-            else:
-                # Check if this tier should be collapsed
-                if tier in self.app_data.collapsed_tiers:
-                    tier_color = self._get_tier_color(tier)
-                    lines.append(f"{tier.value:<9}   [{tier_color}][██████████████████████][/{tier_color}]")
-                else:
-                    # Show all 4 divisions for this tier
-                    for div in range(1, 5):
-                        bars = self._create_bar_display(tier, div, current_rank)
-                        # Only show goal marker if goal not yet achieved
-                        goal_marker = ""
-                        if self._is_goal_rank(tier, div):
-                            current_rank = self.app_data.get_current_rank()
-                            stats = self.app_data.stats
-                            goal_attained = self._is_goal_attained(current_rank, stats.session_goal_tier, stats.session_goal_division)
-                            if not goal_attained:
-                                goal_marker = " ←GOAL"
-                        
-                        
-                        # Highlight current position with tier-colored background
-                        if tier == current_rank.tier and div == current_rank.division:
-                            tier_color = self._get_tier_color(tier)
-                            tier_text = f"[black on {tier_color}]{tier.value:<9}[/black on {tier_color}]"
-                            div_text = f"[black on {tier_color}]{div}[/black on {tier_color}]"
-                            
-                            # Add boss fight indicator to current tier line
-                            boss_marker = " ⚔️ [bold red]BOSS TIER![/bold red]" if current_rank.is_boss_fight() else ""
-                        else:
-                            tier_text = f"{tier.value:<9}"
-                            div_text = f"{div}"
-                            boss_marker = ""
-                        
-                        lines.append(f"{tier_text} {div_text} {bars}{goal_marker}{boss_marker}")
-        
-        return Static("\n".join(lines), classes="rank-bars")
-    
-    def _create_bar_display(self, tier: RankTier, division: int, current_rank: ManualRank) -> str:
-        """Create bar display showing current progress vs highest achieved."""
-        # Use the app's current format to determine bar count
-        max_pips = 6 if self.app_data.current_format in [FormatType.CONSTRUCTED_BO1, FormatType.CONSTRUCTED_BO3] else 4
-        bars = []
-        
-        # Get current progress for this tier/division
-        current_pips = 0
-        if tier == current_rank.tier and division == current_rank.division:
-            current_pips = current_rank.pips
-        elif self._is_position_filled(tier, division, current_rank):
-            current_pips = max_pips  # Fully completed
-        
-        # Get highest achieved progress for this tier/division
-        highest_pips = 0
-        if self.app_data.stats.season_highest_rank:
-            highest_rank = self.app_data.stats.season_highest_rank
-            
-            # Handle case where it might be a dict (backwards compatibility)
-            if isinstance(highest_rank, dict):
-                try:
-                    highest_rank = ManualRank(**highest_rank)
-                    self.app_data.stats.season_highest_rank = highest_rank
-                except:
-                    highest_rank = None
-            
-            if highest_rank:
-                if tier == highest_rank.tier and division == highest_rank.division:
-                    highest_pips = highest_rank.pips
-                elif self._is_position_filled_for_rank(tier, division, highest_rank):
-                    highest_pips = max_pips  # Fully completed by highest rank
-        
-        # Create visual representation: current [██] vs highest [░░] vs empty [  ]
-        tier_color = self._get_tier_color(tier)
-        
-        for i in range(max_pips):
-            if i < current_pips:
-                # Current progress - solid bars with tier color
-                bars.append(f"[{tier_color}][██][/{tier_color}]")
-            elif i < highest_pips:
-                # Highest achieved beyond current - light gray bars
-                bars.append("[rgb(128,128,128)][░░][/rgb(128,128,128)]")
-            else:
-                # Not achieved - empty
-                bars.append("[  ]")
-        
-        return "".join(bars)
-    
-    def _get_tier_color(self, tier: RankTier) -> str:
-        """Get the color for a specific tier."""
-        tier_colors = {
-            RankTier.BRONZE: "rgb(139,69,19)",    # Bronze
-            RankTier.SILVER: "rgb(192,192,192)",  # Silver
-            RankTier.GOLD: "rgb(255,215,0)",      # Gold
-            RankTier.PLATINUM: "rgb(0,206,209)",  # Cyan/Teal
-            RankTier.DIAMOND: "rgb(138,43,226)",  # Royal purple
-            RankTier.MYTHIC: "rgb(255,140,0)"     # True planeswalker orange
-        }
-        return tier_colors.get(tier, "white")
-    
-    def _is_position_filled(self, tier: RankTier, division: int, current_rank: ManualRank) -> bool:
-        """Check if a rank position should be displayed as filled."""
-        # Don't try to fill mythic bars - mythic doesn't have bars
-        if tier == RankTier.MYTHIC:
-            return False
-            
-        # If current rank is mythic, all non-mythic positions are filled
-        if current_rank.is_mythic():
-            return True
-        
-        tier_order = list(RankTier)[:-1]  # Exclude Mythic
-        current_tier_idx = tier_order.index(current_rank.tier)
-        check_tier_idx = tier_order.index(tier)
-        
-        # Lower tiers are filled
-        if check_tier_idx < current_tier_idx:
-            return True
-        
-        # Same tier, lower divisions are filled
-        if check_tier_idx == current_tier_idx and division > current_rank.division:
-            return True
-        
-        return False
-    
-    def _is_position_filled_for_rank(self, tier: RankTier, division: int, rank: ManualRank) -> bool:
-        """Check if a rank position should be displayed as filled for a specific rank."""
-        # Don't try to fill mythic bars - mythic doesn't have bars
-        if tier == RankTier.MYTHIC:
-            return False
-            
-        # If the rank is mythic, all non-mythic positions are filled
-        if rank.is_mythic():
-            return True
-        
-        tier_order = list(RankTier)[:-1]  # Exclude Mythic
-        rank_tier_idx = tier_order.index(rank.tier)
-        check_tier_idx = tier_order.index(tier)
-        
-        # Lower tiers are filled
-        if check_tier_idx < rank_tier_idx:
-            return True
-        
-        # Same tier, lower divisions are filled
-        if check_tier_idx == rank_tier_idx and division > rank.division:
-            return True
-        
-        return False
-    
-    def _is_goal_rank(self, tier: RankTier, division: int) -> bool:
-        """Check if this is the session goal rank."""
         stats = self.app_data.stats
-        return (stats.session_goal_tier == tier and 
-                stats.session_goal_division == division)
+        goal = None  # Only marked until it's reached
+        if stats.session_goal_tier and not self._is_goal_attained(current_rank, stats.session_goal_tier, stats.session_goal_division):
+            goal = (stats.session_goal_tier, stats.session_goal_division)
+        lines.append(_render_rank_bars(
+            current_rank,
+            highest_rank,
+            6 if self.app_data.current_format in CONSTRUCTED_FORMATS else 4,
+            tuple(self.app_data.hidden_tiers),
+            tuple(self.app_data.collapsed_tiers),
+            goal
+        ))
+        
+        return "\n".join(lines)
     
     def _is_highest_rank(self, tier: RankTier, division: int) -> bool:
         """Check if this is the season highest achieved rank."""
@@ -468,11 +504,9 @@ class RankProgressPanel(Static):
         current_tier_str = current_rank.tier.value if hasattr(current_rank.tier, 'value') else str(current_rank.tier)
         goal_tier_str = goal_tier.value if hasattr(goal_tier, 'value') else str(goal_tier)
         
-        tier_order = ["Bronze", "Silver", "Gold", "Platinum", "Diamond", "Mythic"]
-        
         try:
-            current_tier_idx = tier_order.index(current_tier_str)
-            goal_tier_idx = tier_order.index(goal_tier_str)
+            current_tier_idx = TIER_INDEX[current_tier_str]
+            goal_tier_idx = TIER_INDEX[goal_tier_str]
             
             # Higher tier achieved
             if current_tier_idx > goal_tier_idx:
@@ -482,7 +516,7 @@ class RankProgressPanel(Static):
             if current_tier_idx == goal_tier_idx:
                 return current_rank.division <= goal_division
                 
-        except ValueError:
+        except KeyError:
             pass
             
         return False
@@ -493,29 +527,58 @@ class StatsPanel(Static):
     def __init__(self, app_data: AppData):
         super().__init__()
         self.app_data = app_data
+        # Section widgets, looked up once on mount
+        self._goal_section = None
+        self._session_section = None
+        self._season_section = None
+        self._history_section = None
+        self._last_session_content = None
+        self._last_sections = (None, None, None)  # Text last pushed to the goal, season and history sections
     
     def compose(self) -> ComposeResult:
         with Vertical():
             yield Static("─ Session & Season Stats ─", classes="panel-header")
             
             # Session goal
-            yield self._create_goal_section()
+            yield Static(classes="goal-section")
             yield Static("─" * 30, classes="separator")
             
             # Current session
-            yield self._create_session_section()
+            yield Static(classes="session-section", id="session-section")
             yield Static("─" * 30, classes="separator")
             
             # Season totals
-            yield self._create_season_section()
+            yield Static(classes="season-section", id="season-section")
             yield Static("─" * 30, classes="separator")
             
             # Session history
-            yield self._create_history_section()
+            yield Static(classes="history-section")
             yield Static("─" * 30, classes="separator")
     
-    def _create_goal_section(self) -> Static:
-        """Create session goal section."""
+    def on_mount(self) -> None:
+        """Look up the sections and fill them in."""
+        self._goal_section = self.query_one(".goal-section", Static)
+        self._session_section = self.query_one("#session-section", Static)
+        self._season_section = self.query_one("#season-section", Static)
+        self._history_section = self.query_one(".history-section", Static)
+        self.update_display()
+    
+    def update_display(self) -> None:
+        """Update every section in place from the current data."""
+        if self._goal_section is None:
+            return  # Not mounted yet
+        self.refresh_session_section()
+        
+        # Update the other sections, skipping any whose text hasn't changed
+        sections = (self._goal_section_content(), self._season_section_content(), self._history_section_content())
+        widgets = (self._goal_section, self._season_section, self._history_section)
+        for widget, content, last in zip(widgets, sections, self._last_sections):
+            if content != last:
+                widget.update(content)
+        self._last_sections = sections
+    
+    def _goal_section_content(self) -> str:
+        """Build the session goal section."""
         stats = self.app_data.stats
         if stats.session_goal_tier:
             tier_name = stats.session_goal_tier.value if hasattr(stats.session_goal_tier, 'value') else stats.session_goal_tier
@@ -531,11 +594,11 @@ class StatsPanel(Static):
             goal_attained = self._is_goal_attained(current_rank, stats.session_goal_tier, stats.session_goal_division)
             
             if goal_attained:
-                return Static(f"🎯 SESSION GOAL: [{goal_text}] ✅ ACHIEVED!", classes="goal-section")
+                return f"🎯 SESSION GOAL: [{goal_text}] ✅ ACHIEVED!"
             else:
-                return Static(f"🎯 SESSION GOAL: [{goal_text}] [G] Change", classes="goal-section")
+                return f"🎯 SESSION GOAL: [{goal_text}] [G] Change"
         else:
-            return Static("🎯 SESSION GOAL: [None]", classes="goal-section")
+            return "🎯 SESSION GOAL: [None]"
     
     def _is_goal_attained(self, current_rank: ManualRank, goal_tier, goal_division) -> bool:
         """Check if the session goal has been attained."""
@@ -550,11 +613,9 @@ class StatsPanel(Static):
         current_tier_str = current_rank.tier.value if hasattr(current_rank.tier, 'value') else str(current_rank.tier)
         goal_tier_str = goal_tier.value if hasattr(goal_tier, 'value') else str(goal_tier)
         
-        tier_order = ["Bronze", "Silver", "Gold", "Platinum", "Diamond", "Mythic"]
-        
         try:
-            current_tier_idx = tier_order.index(current_tier_str)
-            goal_tier_idx = tier_order.index(goal_tier_str)
+            current_tier_idx = TIER_INDEX[current_tier_str]
+            goal_tier_idx = TIER_INDEX[goal_tier_str]
             
             # Higher tier achieved
             if current_tier_idx > goal_tier_idx:
@@ -564,124 +625,13 @@ class StatsPanel(Static):
             if current_tier_idx == goal_tier_idx:
                 return current_rank.division <= goal_division
                 
-        except ValueError:
+        except KeyError:
             pass
             
         return False
     
-    def _create_session_section(self) -> Static:
-        """Create current session stats."""
-        stats = self.app_data.stats
-        format_name = self.app_data.current_format.value.upper()
-        
-        # Session timing (active time only, excluding paused time)
-        duration_text = "00m 00s"
-        pause_status = ""
-        if stats.session_start_time:
-            try:
-                duration = stats.get_active_session_duration()
-                total_seconds = int(duration.total_seconds())
-                hours = total_seconds // 3600
-                minutes = (total_seconds % 3600) // 60
-                seconds = total_seconds % 60
-                if hours > 0:
-                    duration_text = f"{hours:02d}h {minutes:02d}m {seconds:02d}s"
-                elif minutes > 0:
-                    duration_text = f"{minutes:02d}m {seconds:02d}s"
-                else:
-                    duration_text = f"00m {seconds:02d}s"
-                
-                # Add pause indicator
-                if stats.session_paused:
-                    pause_status = " ⏸️ PAUSED"
-                
-            except:
-                duration_text = "00m 00s"
-        
-        # Format start time safely
-        start_time = "Not set"
-        if stats.session_start_time:
-            try:
-                if isinstance(stats.session_start_time, str):
-                    session_start = datetime.fromisoformat(stats.session_start_time)
-                else:
-                    session_start = stats.session_start_time
-                start_time = session_start.strftime("%I:%M %p")
-            except:
-                start_time = "Invalid time"
-        
-        # Streak info
-        if stats.current_win_streak > 0:
-            streak_text = f"W{stats.current_win_streak}"
-        elif stats.current_loss_streak > 0:
-            streak_text = f"L{stats.current_loss_streak}"
-        else:
-            streak_text = "None"
-        
-        current_streak_text = f"{stats.current_win_streak} / L{stats.current_loss_streak}"
-        
-        # Time since last result - show both real and active time
-        last_result_text = "No games yet"
-        if stats.last_result_time:
-            try:
-                real_seconds, active_seconds = stats.get_time_since_last_result()
-                
-                # Format real time
-                real_minutes = real_seconds // 60
-                real_secs = real_seconds % 60
-                real_text = f"{real_minutes:02d}m {real_secs:02d}s"
-                
-                # Format active time 
-                active_minutes = active_seconds // 60
-                active_secs = active_seconds % 60
-                active_text = f"{active_minutes:02d}m {active_secs:02d}s"
-                
-                # Show both if different, otherwise just one
-                if real_seconds != active_seconds:
-                    last_result_text = f"{real_text} ago ({active_text} active)"
-                else:
-                    last_result_text = f"{real_text} ago"
-                    
-            except:
-                last_result_text = "Invalid time"
-        
-        # Game timer info
-        game_timer_text = ""
-        avg_game_text = ""
-        if stats.game_start_time:
-            game_seconds = int(stats.get_current_game_duration())
-            game_minutes = game_seconds // 60
-            game_secs = game_seconds % 60
-            game_timer_text = f"  Current: {game_minutes:02d}m {game_secs:02d}s ⏰"
-        
-        if stats.game_durations:
-            avg_seconds = int(stats.get_average_game_duration())
-            avg_minutes = avg_seconds // 60
-            avg_secs = avg_seconds % 60
-            avg_game_text = f"Avg Game: [{avg_minutes:02d}m {avg_secs:02d}s]  "
-        
-        # Generate L10 display (last 10 games)
-        l10_display = ""
-        if hasattr(stats, 'session_game_results') and stats.session_game_results:
-            # Show last 10 games with emojis
-            recent_games = stats.session_game_results[-10:]  # Get last 10
-            game_emojis = []
-            for result in recent_games:
-                if result == 'W':
-                    game_emojis.append('🟢')  # Green circle for win
-                elif result == 'L':
-                    game_emojis.append('🔴')  # Red circle for loss
-                else:
-                    game_emojis.append('⚪')  # White circle for unknown
-            l10_display = f"L10: {''.join(game_emojis)}"
-        else:
-            l10_display = "L10: No games yet"
-
-        session_content = self._generate_session_content()
-        return Static(session_content, classes="session-section", id="session-section")
-    
-    def _create_season_section(self) -> Static:
-        """Create season total stats."""
+    def _season_section_content(self) -> str:
+        """Build the season total stats."""
         stats = self.app_data.stats
         format_name = self.app_data.current_format.value.upper()
         
@@ -732,10 +682,10 @@ class StatsPanel(Static):
         season_content = f"""🏆 SEASON TOTAL [{format_name}] ({total_games})
 Record:   [{stats.season_wins}W] - [{stats.season_losses}L]  {win_rate:.2f}%"""
         
-        return Static(season_content, classes="season-section", id="season-section")
+        return season_content
     
-    def _create_history_section(self) -> Static:
-        """Create recent game notes section."""
+    def _history_section_content(self) -> str:
+        """Build the recent game notes section."""
         stats = self.app_data.stats
         
         # Dedicated notes section
@@ -778,28 +728,20 @@ Record:   [{stats.season_wins}W] - [{stats.season_losses}L]  {win_rate:.2f}%"""
             notes_lines.append("Track matchups, strategies, and")
             notes_lines.append("key moments from your games.")
         
-        return Static("\n".join(notes_lines), classes="history-section")
+        return "\n".join(notes_lines)
     
-    def _generate_session_content(self) -> str:
+    def _generate_session_content(self, now: Optional[datetime] = None) -> str:
         """Generate session content string - single source of truth for session display."""
         stats = self.app_data.stats
+        if now is None:
+            now = datetime.now()  # One clock read for every timer in the section
         format_name = self.app_data.current_format.value.upper()
         
         # Session timing (active time only)
         duration_text = "00m 00s"
         pause_status = ""
         if stats.session_start_time:
-            duration = stats.get_active_session_duration()
-            total_seconds = int(duration.total_seconds())
-            hours = total_seconds // 3600
-            minutes = (total_seconds % 3600) // 60
-            seconds = total_seconds % 60
-            if hours > 0:
-                duration_text = f"{hours:02d}h {minutes:02d}m {seconds:02d}s"
-            elif minutes > 0:
-                duration_text = f"{minutes:02d}m {seconds:02d}s"
-            else:
-                duration_text = f"00m {seconds:02d}s"
+            duration_text = _format_duration(int(stats.get_active_session_duration(now).total_seconds()))
             
             # Add pause indicator
             if stats.session_paused:
@@ -831,17 +773,10 @@ Record:   [{stats.season_wins}W] - [{stats.season_losses}L]  {win_rate:.2f}%"""
         last_result_text = "No games yet"
         if stats.last_result_time:
             try:
-                real_seconds, active_seconds = stats.get_time_since_last_result()
-                
-                # Format real time
-                real_minutes = real_seconds // 60
-                real_secs = real_seconds % 60
-                real_text = f"{real_minutes:02d}m {real_secs:02d}s"
+                real_seconds, active_seconds = stats.get_time_since_last_result(now)
                 
-                # Format active time 
-                active_minutes = active_seconds // 60
-                active_secs = active_seconds % 60
-                active_text = f"{active_minutes:02d}m {active_secs:02d}s"
+                real_text = _format_minutes(real_seconds)
+                active_text = _format_minutes(active_seconds)
                 
                 # Show both if different, otherwise just one
                 if real_seconds != active_seconds:
@@ -856,31 +791,17 @@ Record:   [{stats.season_wins}W] - [{stats.season_losses}L]  {win_rate:.2f}%"""
         game_timer_text = ""
         avg_game_text = ""
         if stats.game_start_time:
-            game_seconds = int(stats.get_current_game_duration())
-            game_minutes = game_seconds // 60
-            game_secs = game_seconds % 60
-            game_timer_text = f"  Current: {game_minutes:02d}m {game_secs:02d}s ⏰"
+            game_timer_text = f"  Current: {_format_minutes(int(stats.get_current_game_duration(now)))} ⏰"
         
         if stats.game_durations:
-            avg_seconds = int(stats.get_average_game_duration())
-            avg_minutes = avg_seconds // 60
-            avg_secs = avg_seconds % 60
-            avg_game_text = f"Avg Game: [{avg_minutes:02d}m {avg_secs:02d}s]  "
+            avg_game_text = f"Avg Game: [{_format_minutes(int(stats.get_average_game_duration()))}]  "
         
         # Generate L10 display (last 10 games)
         l10_display = ""
         if hasattr(stats, 'session_game_results') and stats.session_game_results:
             # Show last 10 games with emojis
             recent_games = stats.session_game_results[-10:]  # Get last 10
-            game_emojis = []
-            for result in recent_games:
-                if result == 'W':
-                    game_emojis.append('🟢')  # Green circle for win
-                elif result == 'L':
-                    game_emojis.append('🔴')  # Red circle for loss
-                else:
-                    game_emojis.append('⚪')  # White circle for unknown
-            l10_display = f"L10: {''.join(game_emojis)}"
+            l10_display = f"L10: {''.join([_RESULT_EMOJI.get(result, '⚪') for result in recent_games])}"  # White circle for unknown
         else:
             l10_display = "L10: No games yet"
         
@@ -911,14 +832,17 @@ Streak:   {current_streak_text}
         # Progress = reduction in bars remaining (higher rank = fewer bars remaining)
         return start_bars - current_bars
     
-    def refresh_session_section(self) -> None:
+    def refresh_session_section(self, now: Optional[datetime] = None) -> None:
         """Refresh the session section with updated timer data."""
+        if self._session_section is None:
+            return  # Not mounted yet
         try:
-            session_section = self.query_one("#session-section", Static)
-            session_content = self._generate_session_content()
-            session_section.update(session_content)
+            session_content = self._generate_session_content(now)
+            if session_content != self._last_session_content:
+                self._session_section.update(session_content)
+                self._last_session_content = session_content
         except:
-            pass  # Ignore if section not found
+            pass  # Keep the last timer text if the stats can't be formatted
 
 class EditStatsModal(ModalScreen):
     """Modal dialog for editing session/season stats."""
@@ -1256,7 +1180,7 @@ class SetRankModal(ModalScreen):
                     pips_label.display = False
                 yield pips_label
                 
-                max_pips = 6 if self.format_type in [FormatType.CONSTRUCTED_BO1, FormatType.CONSTRUCTED_BO3] else 4
+                max_pips = 6 if self.format_type in CONSTRUCTED_FORMATS else 4
                 pip_options = [(str(i), str(i)) for i in range(max_pips)]
                 pips_select = Select(pip_options, value=str(self.current_rank.pips), id="pips-select")
                 if current_tier == "Mythic":
@@ -1500,6 +1424,7 @@ class NotesManagerModal(ModalScreen):
         self.has_changes = False
     
     def compose(self) -> ComposeResult:
+        from textual.widgets import DataTable  # Slow to import, so only loaded once the modal opens
         with Container(id="notes-manager-dialog"):
             yield Label("Game Notes Manager", classes="modal-title")
             yield Label("Use ↑↓ to select, Enter to edit, Delete to remove", classes="help-text")
@@ -1565,6 +1490,7 @@ class NotesManagerModal(ModalScreen):
     
     def action_edit_selected(self) -> None:
         """Edit the selected note."""
+        from textual.widgets import DataTable
         # Try to get the currently highlighted row from the table
         table = self.query_one("#notes-table", DataTable)
         
@@ -1605,6 +1531,7 @@ class NotesManagerModal(ModalScreen):
     
     def action_delete_selected(self) -> None:
         """Delete the selected note."""
+        from textual.widgets import DataTable
         # Try to get the currently highlighted row from the table
         table = self.query_one("#notes-table", DataTable)
         
@@ -1652,6 +1579,7 @@ class NotesManagerModal(ModalScreen):
     
     def _refresh_table(self) -> None:
         """Refresh the table display after changes."""
+        from textual.widgets import DataTable
         table = self.query_one("#notes-table", DataTable)
         table.clear()
         
@@ -1769,6 +1697,7 @@ class GameNotesModal(ModalScreen):
         self.is_editing = existing_note is not None
     
     def compose(self) -> ComposeResult:
+        from textual.widgets import TextArea  # Slow to import, so only loaded once the modal opens
         with Container(id="notes-dialog"):
             title = "Edit Game Notes" if self.is_editing else "Add Game Notes"
             yield Label(title, classes="modal-title")
@@ -1820,6 +1749,7 @@ class GameNotesModal(ModalScreen):
     
     def _get_note_data(self):
         """Extract note data from the form."""
+        from textual.widgets import TextArea
         result_select = self.query_one("#result-select", Select)
         play_draw_select = self.query_one("#play-draw-select", Select)
         opp_deck_input = self.query_one("#opp-deck-input", Input)
@@ -1921,202 +1851,39 @@ class AboutModal(ModalScreen):
 
 # === MAIN APPLICATION ===
 
+# Shown by action_help
+HELP_TEXT = """MTGA Manual Tracker Help
+
+Keyboard Shortcuts:
+W/+ - Add win       L/- - Add loss
+F - Switch format (BO1/BO3/Limited)  
+G - Set session goal    T - Set season start rank
+E - Edit stats (streaks, session start)
+N - Add game notes    Ctrl+N - View all notes
+M - Toggle mythic progress
+C - Collapse tiers      H - Hide tiers
+R - Restart session     P - Pause/Resume timer
+Shift+S - Start game    S - Set rank manually   
+Ctrl+Q - Quit           I - About/Info
+
+Manual Editing:
+Click any [bracketed] value to edit inline
+Click rank bars to set exact position
+ESC to cancel editing
+
+Press any key to close this help."""
+
+# Seconds without changes before state is autosaved
+AUTOSAVE_DELAY = 2.0
+# Longest a change can wait to be saved while changes keep coming
+AUTOSAVE_MAX_DELAY = 5.0
+
 class ManualTUIApp(App):
     """Main TUI application for manual rank tracking."""
     
     TITLE = "MTGA Mythic TUI Session Tracker (Manual)"
     
-    CSS = """
-    Screen {
-        layout: vertical;
-    }
-    
-    .top-panel {
-        dock: top;
-        height: 3;
-        border: solid $primary;
-        padding: 0 1;
-    }
-    
-    .top-panel-layout {
-        height: 100%;
-    }
-    
-    .top-season {
-        width: 40%;
-        height: 100%;
-        padding: 0 1;
-        content-align: left middle;
-    }
-    
-    .top-format {
-        width: 20%;
-        height: 100%;
-        content-align: center middle;
-    }
-    
-    .top-bars {
-        width: 20%;
-        height: 100%;
-        content-align: center middle;
-    }
-    
-    .top-rank {
-        width: 20%;
-        height: 100%;
-        content-align: right middle;
-        padding: 0 1;
-    }
-    
-    #main-content {
-        layout: horizontal;
-        height: 1fr;
-        overflow-y: auto;
-    }
-    
-    .left-panel, .right-panel {
-        width: 50%;
-        height: 100%;
-        border: solid $primary;
-        margin: 1;
-        padding: 1;
-        overflow-y: auto;
-    }
-    
-    .footer-controls {
-        dock: bottom;
-        height: 1;
-        background: $surface;
-        content-align: center middle;
-    }
-    
-    .panel-header {
-        text-style: bold;
-        text-align: center;
-        color: $accent;
-    }
-    
-    .separator {
-        color: $primary;
-    }
-    
-    .help-text, .controls {
-        color: $text-muted;
-        text-align: center;
-        margin: 1 0;
-    }
-    
-    .format-hint {
-        color: $text-muted;
-        text-align: center;
-        margin: 0 1;
-        text-style: italic;
-    }
-    
-    .mythic-display {
-        text-align: center;
-        color: $warning;
-        text-style: bold;
-    }
-    
-    .rank-row {
-        margin: 0 0 0 1;
-    }
-    
-    .bronze-tier { color: #CD7F32; }
-    .silver-tier { color: #C0C0C0; }
-    .gold-tier { color: #FFD700; }
-    .platinum-tier { color: #E5E4E2; }
-    .diamond-tier { color: #B9F2FF; }
-    .mythic-row { color: #FF4500; }
-    
-    .collapsed { color: $text-muted; }
-    
-    .switch-button {
-        width: 100%;
-        margin: 0 0 1 0;
-    }
-    
-    .goal-section, .session-section, .season-section, .history-section {
-        margin: 1 0;
-    }
-    
-    .modal-container {
-        width: 50;
-        height: 10;
-        border: solid $primary;
-        background: $surface;
-        padding: 2;
-    }
-    
-    .modal-message {
-        text-align: center;
-        margin: 0 0 2 0;
-    }
-    
-    .modal-buttons {
-        align: center middle;
-    }
-    
-    .editable-display:hover {
-        background: $accent 30%;
-        text-style: underline;
-    }
-    
-    .hidden {
-        display: none;
-    }
-    
-    /* Modal Styling */
-    ConfirmationModal {
-        align: center middle;
-    }
-    
-    SetRankModal {
-        align: center middle;
-    }
-    
-    .confirmation-modal-container {
-        width: 50;
-        height: 12;
-        border: solid $primary;
-        background: $surface;
-        padding: 1;
-    }
-    
-    .rank-modal-container {
-        width: 60;
-        height: 35;
-        border: solid $primary;
-        background: $surface;
-        padding: 2;
-        overflow-y: auto;
-    }
-    
-    SetGoalModal {
-        align: center middle;
-    }
-    
-    .goal-modal-container {
-        width: 60;
-        height: 25;
-        border: solid $primary;
-        background: $surface;
-        padding: 2;
-        overflow-y: auto;
-    }
-    
-    .confirmation-modal-message {
-        width: 100%;
-        text-align: center;
-        margin: 1 0;
-    }
-    
-    .confirmation-modal-buttons {
-        width: 100%;
-        align: center middle;
-    }
-    """
+    CSS_PATH = "styles/manual_tui.tcss"
     
     BINDINGS = [
         Binding("w", "add_win", "Add Win"),
@@ -2145,6 +1912,15 @@ class ManualTUIApp(App):
         super().__init__()
         self.state_manager = state_manager
         self.app_data = state_manager.load_state()
+        self._save_timer = None  # Pending autosave, see schedule_save()
+        self._unsaved_since = None  # time.monotonic() of the oldest unsaved change
+        # Panels, looked up once on mount and then updated in place
+        self._top_panel = None
+        self._rank_panel = None
+        self._stats_panel = None
+        self._status_timer = None  # 1 Hz status tick, paused while no timer is visible
+        self._rank_panel_key = None  # RankProgressPanel.content_key() of what the rank panel shows
+        self._refresh_pending = False  # A panel rebuild is already scheduled
     
     def compose(self) -> ComposeResult:
         with Container():
@@ -2158,39 +1934,85 @@ class ManualTUIApp(App):
     
     def on_mount(self) -> None:
         """Initialize the app on mount."""
+        # The panels are never remounted, so look them up once
+        self._top_panel = self.query_one(TopPanel)
+        self._rank_panel = self.query_one(RankProgressPanel)
+        self._stats_panel = self.query_one(StatsPanel)
+        self._rank_panel_key = RankProgressPanel.content_key(self.app_data)
+        
         # Create timer for status updates after app is mounted
-        self.set_interval(1.0, self.update_status)
+        self._status_timer = self.set_interval(1.0, self.update_status)
         self.update_status()
     
+    def _has_running_clock(self, now: datetime) -> bool:
+        """Check whether anything on screen counts up or down with the clock."""
+        stats = self.app_data.stats
+        if stats.season_end_date and stats.season_end_date > now:
+            return True
+        if stats.session_start_time and not stats.session_paused:
+            return True
+        # Time since last result and the game timer keep counting while paused
+        return bool(stats.last_result_time or stats.game_start_time)
+    
     def update_status(self) -> None:
         """Update top panel and status."""
+        now = datetime.now()  # Shared by every timer shown this tick
+        
+        # Only tick while a timer is visible - every action calls this again via refresh_panels
+        if self._status_timer is not None:
+            if self._has_running_clock(now):
+                self._status_timer.resume()
+            else:
+                self._status_timer.pause()
+        
         try:
-            top_panel = self.query_one(TopPanel)
-            top_panel.update_display()
+            if self._top_panel is not None:
+                self._top_panel.update_display(now)
         except Exception as e:
             # DEBUG: Log top panel update errors
             self.notify(f"Top panel update error: {e}", severity="error")
         
         # Update timer-based elements in stats panel
         try:
-            self._update_session_timers()
+            self._update_session_timers(now)
         except Exception as e:
             # DEBUG: Log timer update errors
             self.notify(f"Timer update error: {e}", severity="error")
-        
-        # Save state periodically
+    
+    def schedule_save(self) -> None:
+        """Save state once it has been left alone for AUTOSAVE_DELAY seconds."""
+        if self._save_timer is not None:
+            self._save_timer.stop()
+            self._save_timer = None
+        
+        now = time.monotonic()
+        if self._unsaved_since is None:
+            self._unsaved_since = now
+        elif now - self._unsaved_since >= AUTOSAVE_MAX_DELAY:
+            # Don't let a steady stream of changes hold the save off indefinitely
+            self._flush_save()
+            return
+        self._save_timer = self.set_timer(AUTOSAVE_DELAY, self._flush_save)
+    
+    def _flush_save(self) -> None:
+        """Save state now if anything changed since the last save."""
+        if self._save_timer is not None:
+            self._save_timer.stop()
+            self._save_timer = None
+        if self._unsaved_since is None:
+            return  # Nothing to save
+        self._unsaved_since = None
         try:
             self.state_manager.save_state(self.app_data)
         except Exception as e:
             # DEBUG: Log save errors
             self.notify(f"Save error: {e}", severity="error")
     
-    def _update_session_timers(self) -> None:
+    def _update_session_timers(self, now: Optional[datetime] = None) -> None:
         """Update session duration and last result timers."""
         try:
-            # Find stats panel and tell it to refresh its session section
-            stats_panel = self.query_one(StatsPanel)
-            stats_panel.refresh_session_section()
+            # Tell the stats panel to refresh its session section
+            self._stats_panel.refresh_session_section(now)
             # DEBUG: Confirm timer is running
             # self.notify("Timer tick", timeout=0.5)  # Uncomment to see if timer runs
         except Exception as e:
@@ -2228,10 +2050,11 @@ class ManualTUIApp(App):
         self.app_data.set_current_rank(new_rank)
         
         # End game timer and record duration
-        game_duration = self.app_data.stats.end_game_timer()
+        now = datetime.now()
+        game_duration = self.app_data.stats.end_game_timer(now)
         
         # Update stats
-        self.app_data.stats.add_win()
+        self.app_data.stats.add_win(now)
         
         # Check if goal was just achieved
         if not was_goal_achieved and stats.session_goal_tier:
@@ -2260,10 +2083,11 @@ class ManualTUIApp(App):
         self.app_data.set_current_rank(new_rank)
         
         # End game timer and record duration
-        game_duration = self.app_data.stats.end_game_timer()
+        now = datetime.now()
+        game_duration = self.app_data.stats.end_game_timer(now)
         
         # Update stats
-        self.app_data.stats.add_loss()
+        self.app_data.stats.add_loss(now)
         
         # Refresh display
         self.refresh_panels()
@@ -2273,26 +2097,13 @@ class ManualTUIApp(App):
         # Cycle through format types
         if self.app_data.current_format == FormatType.CONSTRUCTED_BO1:
             self.app_data.current_format = FormatType.CONSTRUCTED_BO3
-            new_format = "BO3"
         elif self.app_data.current_format == FormatType.CONSTRUCTED_BO3:
             self.app_data.current_format = FormatType.LIMITED
-            new_format = "LIMITED"
         else:  # LIMITED
             self.app_data.current_format = FormatType.CONSTRUCTED_BO1
-            new_format = "BO1"
         
-        # Immediately update just the format column
-        try:
-            format_widget = self.query_one(".top-format", Static)
-            format_widget.update(f"📊 {new_format}")
-        except:
-            pass
-        
-        # Force immediate update of everything
+        # Force immediate update of everything, including the top panel
         self.refresh_panels()
-        
-        # Also call update_status to ensure top panel updates
-        self.update_status()
     
     def action_set_goal(self) -> None:
         """Set session goal rank via modal."""
@@ -2354,7 +2165,7 @@ class ManualTUIApp(App):
                 self.app_data.stats.game_notes.append(note_entry)
                 
                 # Save state
-                self.state_manager.save_state(self.app_data)
+                self.schedule_save()
                 
                 # Show summary toast
                 note_summary = f"{result['play_draw']}"
@@ -2378,7 +2189,7 @@ class ManualTUIApp(App):
         def handle_manager_result(result):
             if result in ["updated", "deleted"]:
                 # Save state and refresh display
-                self.state_manager.save_state(self.app_data)
+                self.schedule_save()
                 self.refresh_panels()
                 
                 action_text = "updated" if result == "updated" else "deleted"
@@ -2416,7 +2227,7 @@ class ManualTUIApp(App):
                     win_rate = (stats.season_wins / total_games * 100) if total_games > 0 else 0.0
                     format_name = self.app_data.current_format.value.upper()
                     
-                    # Format highest rank achieved (same logic as _create_season_section)
+                    # Format highest rank achieved (same logic as _season_section_content)
                     highest_text = "Not set"
                     if stats.season_highest_rank:
                         highest_rank = stats.season_highest_rank
@@ -2464,7 +2275,7 @@ Record:   [{stats.season_wins}W] - [{stats.season_losses}L]  {win_rate:.2f}%"""
                 # Schedule another refresh after the next render cycle
                 self.call_after_refresh(lambda: self.notify(f"Stats updated! Session: {stats.get_session_win_rate():.2f}%, Season: {win_rate:.2f}%", severity="success"))
                 
-                self.state_manager.save_state(self.app_data)
+                self.schedule_save()
         
         self.push_screen(modal, handle_result)
     
@@ -2473,55 +2284,39 @@ Record:   [{stats.season_wins}W] - [{stats.season_losses}L]  {win_rate:.2f}%"""
         self.app_data.show_mythic_progress = not self.app_data.show_mythic_progress
         self.refresh_panels()
     
-    def action_collapse_tiers(self) -> None:
-        """Toggle auto-collapse mode for completed tiers."""
-        # Toggle auto-collapse mode
-        self.app_data.auto_collapse_mode = not self.app_data.auto_collapse_mode
+    def _toggle_completed_tiers(self, tiers: list, enabled: bool) -> bool:
+        """Add all completed tiers to tiers, or clear it when disabled.
         
-        current_rank = self.app_data.get_current_rank()
-        tier_order = list(RankTier)[:-1]  # Exclude Mythic
+        Returns whether the list changed.
+        """
+        if not enabled:
+            changed = bool(tiers)
+            tiers.clear()
+            return changed
         
-        if self.app_data.auto_collapse_mode:
-            # Enable auto-collapse: collapse all currently completed tiers
-            if current_rank.is_mythic():
-                completed_tiers = tier_order
-            else:
-                current_tier_idx = tier_order.index(current_rank.tier)
-                completed_tiers = tier_order[:current_tier_idx]
-            
-            for tier in completed_tiers:
-                if tier not in self.app_data.collapsed_tiers:
-                    self.app_data.collapsed_tiers.append(tier)
+        current_rank = self.app_data.get_current_rank()
+        if current_rank.is_mythic():
+            completed_tiers = TIER_ORDER_NO_MYTHIC
         else:
-            # Disable auto-collapse: uncollapse all tiers
-            self.app_data.collapsed_tiers.clear()
+            completed_tiers = TIER_ORDER_NO_MYTHIC[:TIER_INDEX[current_rank.tier]]
         
-        self.refresh_panels()
+        return add_tiers(tiers, completed_tiers)
+    
+    def action_collapse_tiers(self) -> None:
+        """Toggle auto-collapse mode for completed tiers."""
+        self.app_data.auto_collapse_mode = not self.app_data.auto_collapse_mode
+        if self._toggle_completed_tiers(self.app_data.collapsed_tiers, self.app_data.auto_collapse_mode):
+            self.refresh_panels()
+        else:
+            self.schedule_save()  # Only the mode changed, nothing to redraw
     
     def action_hide_tiers(self) -> None:
         """Toggle auto-hide mode for completed tiers completely."""
-        # Toggle auto-hide mode
         self.app_data.auto_hide_mode = not self.app_data.auto_hide_mode
-        
-        current_rank = self.app_data.get_current_rank()
-        tier_order = list(RankTier)[:-1]  # Exclude Mythic
-        
-        if self.app_data.auto_hide_mode:
-            # Enable auto-hide: hide all currently completed tiers
-            if current_rank.is_mythic():
-                completed_tiers = tier_order
-            else:
-                current_tier_idx = tier_order.index(current_rank.tier)
-                completed_tiers = tier_order[:current_tier_idx]
-            
-            for tier in completed_tiers:
-                if tier not in self.app_data.hidden_tiers:
-                    self.app_data.hidden_tiers.append(tier)
+        if self._toggle_completed_tiers(self.app_data.hidden_tiers, self.app_data.auto_hide_mode):
+            self.refresh_panels()
         else:
-            # Disable auto-hide: unhide all tiers
-            self.app_data.hidden_tiers.clear()
-        
-        self.refresh_panels()
+            self.schedule_save()  # Only the mode changed, nothing to redraw
     
     def action_restart_session(self) -> None:
         """Restart current session (same as reset)."""
@@ -2580,15 +2375,13 @@ Record:   [{stats.season_wins}W] - [{stats.season_losses}L]  {win_rate:.2f}%"""
     
     def _check_tier_promotions(self, new_rank: ManualRank, old_rank: ManualRank) -> None:
         """Check for tier promotions and show celebration toasts."""
-        tier_order = ["Bronze", "Silver", "Gold", "Platinum", "Diamond", "Mythic"]
-        
         old_tier_name = old_rank.tier.value if hasattr(old_rank.tier, 'value') else str(old_rank.tier)
         new_tier_name = new_rank.tier.value if hasattr(new_rank.tier, 'value') else str(new_rank.tier)
         
         if old_tier_name != new_tier_name:
             try:
-                old_tier_idx = tier_order.index(old_tier_name)
-                new_tier_idx = tier_order.index(new_tier_name)
+                old_tier_idx = TIER_INDEX[old_tier_name]
+                new_tier_idx = TIER_INDEX[new_tier_name]
                 
                 if new_tier_idx > old_tier_idx:
                     # Tier promotion!
@@ -2596,7 +2389,7 @@ Record:   [{stats.season_wins}W] - [{stats.season_losses}L]  {win_rate:.2f}%"""
                         self.notify("🏆 MYTHIC ACHIEVED! Welcome to the top tier! 🏆", severity="success")
                     else:
                         self.notify(f"⬆️ TIER PROMOTION: Welcome to {new_tier_name}! ⬆️", severity="success")
-            except ValueError:
+            except KeyError:
                 pass  # Unknown tier names
     
     def _check_win_milestones(self, win_count: int, scope: str) -> None:
@@ -2687,28 +2480,10 @@ Record:   [{stats.season_wins}W] - [{stats.season_losses}L]  {win_rate:.2f}%"""
     
     def action_help(self) -> None:
         """Show help information."""
-        help_text = """MTGA Manual Tracker Help
-
-Keyboard Shortcuts:
-W/+ - Add win       L/- - Add loss
-F - Switch format (BO1/BO3/Limited)  
-G - Set session goal    T - Set season start rank
-E - Edit stats (streaks, session start)
-N - Add game notes    Ctrl+N - View all notes
-M - Toggle mythic progress
-C - Collapse tiers      H - Hide tiers
-R - Restart session     P - Pause/Resume timer
-Shift+S - Start game    S - Set rank manually   
-Ctrl+Q - Quit           I - About/Info
-
-Manual Editing:
-Click any [bracketed] value to edit inline
-Click rank bars to set exact position
-ESC to cancel editing
-
-Press any key to close this help."""
-        
-        self.push_screen(ConfirmationModal(help_text))
+        # Keep one help screen installed rather than building a new one each time
+        if not self.is_screen_installed("help"):
+            self.install_screen(ConfirmationModal(HELP_TEXT), name="help")
+        self.push_screen("help")
     
     def action_about(self) -> None:
         """Show about dialog with project info and licensing."""
@@ -2750,29 +2525,39 @@ Press any key to close this help."""
         self.push_screen(modal, handle_result)
     
     def refresh_panels(self) -> None:
-        """Refresh all panels with current data."""
+        """Refresh all panels with current data.
+        
+        The panels are rebuilt once the messages already queued have been
+        handled, so a burst of key presses only redraws them once.
+        """
+        # Panels are refreshed after every change, so this is where state gets saved
+        self.schedule_save()
+        
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.call_later(self._rebuild_panels)
+    
+    def _rebuild_panels(self) -> None:
+        """Redraw all panels from the current data."""
+        self._refresh_pending = False
+        
         # Update the top panel
         self.update_status()
         
-        # Force refresh of rank progress panel by removing and re-adding
+        # Update both panels in place; the rank bars only when something they show changed
         try:
-            main_content = self.query_one("#main-content")
-            # Remove existing panels
-            left_panel = self.query_one(".left-panel")
-            right_panel = self.query_one(".right-panel")
-            left_panel.remove()
-            right_panel.remove()
-            
-            # Add new panels with updated data
-            main_content.mount(RankProgressPanel(self.app_data).add_class("left-panel"))
-            main_content.mount(StatsPanel(self.app_data).add_class("right-panel"))
+            rank_panel_key = RankProgressPanel.content_key(self.app_data)
+            if rank_panel_key != self._rank_panel_key:
+                self._rank_panel_key = rank_panel_key
+                self._rank_panel.update_display()
+            self._stats_panel.update_display()
         except Exception as e:
             # Log the error but continue
             self.notify(f"Panel refresh error: {e}", severity="warning")
     
-    def on_exit(self) -> None:
-        """Save state before exit."""
-        self.state_manager.save_state(self.app_data)
+    def on_unmount(self) -> None:
+        """Save state before exit, including any autosave still pending."""
+        self._flush_save()
 
 def main():
     """Main entry point with CLI argument parsing."""
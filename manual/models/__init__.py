@@ -4,9 +4,9 @@ Models package for MTGA Manual TUI Tracker.
 Contains all data models and enums used throughout the application.
 """
 
-from .rank import FormatType, RankTier, ManualRank
+from .rank import FormatType, RankTier, ManualRank, TIER_ORDER, TIER_ORDER_NO_MYTHIC, TIER_INDEX, CONSTRUCTED_FORMATS
 from .session import CompletedSession, SessionStats
-from .app_data import AppData
+from .app_data import AppData, add_tiers, remove_tiers
 
 __all__ = [
     'FormatType',
@@ -14,5 +14,11 @@ __all__ = [
     'ManualRank',
     'CompletedSession',
     'SessionStats',
-    'AppData'
+    'AppData',
+    'TIER_ORDER',
+    'TIER_ORDER_NO_MYTHIC',
+    'TIER_INDEX',
+    'CONSTRUCTED_FORMATS',
+    'add_tiers',
+    'remove_tiers'
 ]
\ No newline at end of file
@@ -4,13 +4,31 @@ App data model for MTGA Manual TUI Tracker.
 Contains AppData class that holds the complete application state.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Optional
-from .rank import ManualRank, RankTier, FormatType
+from .rank import ManualRank, RankTier, FormatType, TIER_ORDER_NO_MYTHIC, TIER_INDEX, CONSTRUCTED_FORMATS
 from .session import SessionStats
 
 
-@dataclass
+def add_tiers(tiers: List[RankTier], new_tiers) -> bool:
+    """Append the new_tiers not already in tiers, keeping their order.
+    
+    Returns whether anything was added.
+    """
+    present = set(tiers)
+    added = [tier for tier in new_tiers if tier not in present]
+    tiers.extend(added)
+    return bool(added)
+
+
+def remove_tiers(tiers: List[RankTier], old_tiers) -> None:
+    """Remove every tier in old_tiers from tiers in place."""
+    old_tiers = set(old_tiers)
+    if not old_tiers.isdisjoint(tiers):
+        tiers[:] = [tier for tier in tiers if tier not in old_tiers]
+
+
+@dataclass(slots=True)
 class AppData:
     """Complete application state."""
     constructed_rank: ManualRank
@@ -18,27 +36,21 @@ class AppData:
     current_format: FormatType
     stats: SessionStats
     show_mythic_progress: bool = True
-    collapsed_tiers: List[RankTier] = None
-    hidden_tiers: List[RankTier] = None
+    collapsed_tiers: List[RankTier] = field(default_factory=list)
+    hidden_tiers: List[RankTier] = field(default_factory=list)
     auto_collapse_mode: bool = False
     auto_hide_mode: bool = False
     
-    def __post_init__(self):
-        if self.collapsed_tiers is None:
-            self.collapsed_tiers = []
-        if self.hidden_tiers is None:
-            self.hidden_tiers = []
-    
     def get_current_rank(self) -> ManualRank:
         """Get rank for current format."""
-        if self.current_format in [FormatType.CONSTRUCTED_BO1, FormatType.CONSTRUCTED_BO3]:
+        if self.current_format in CONSTRUCTED_FORMATS:
             return self.constructed_rank
         else:
             return self.limited_rank
     
     def set_current_rank(self, rank: ManualRank):
         """Set rank for current format."""
-        if self.current_format in [FormatType.CONSTRUCTED_BO1, FormatType.CONSTRUCTED_BO3]:
+        if self.current_format in CONSTRUCTED_FORMATS:
             self.constructed_rank = rank
         else:
             self.limited_rank = rank
@@ -51,42 +63,31 @@ class AppData:
     
     def _cleanup_tier_states(self, current_rank: ManualRank):
         """Clean up invalid hide/collapse states and auto-collapse/hide newly completed tiers."""
-        tier_order = list(RankTier)[:-1]  # Exclude Mythic
+        tier_order = TIER_ORDER_NO_MYTHIC
         
         if current_rank.is_mythic():
             # At mythic, all non-mythic tiers are completed
             # If we're in collapse/hide mode, apply to all completed tiers
             if self.collapsed_tiers:
-                for tier in tier_order:
-                    if tier not in self.collapsed_tiers:
-                        self.collapsed_tiers.append(tier)
+                add_tiers(self.collapsed_tiers, tier_order)
             if self.hidden_tiers:
-                for tier in tier_order:
-                    if tier not in self.hidden_tiers:
-                        self.hidden_tiers.append(tier)
+                add_tiers(self.hidden_tiers, tier_order)
             return
         
-        current_tier_idx = tier_order.index(current_rank.tier)
+        current_tier_idx = TIER_INDEX[current_rank.tier]
         completed_tiers = tier_order[:current_tier_idx]  # Tiers below current
         incomplete_tiers = tier_order[current_tier_idx:]  # Current tier and above
         
         # Remove any incomplete tiers from collapsed/hidden lists
-        for tier in incomplete_tiers:
-            if tier in self.collapsed_tiers:
-                self.collapsed_tiers.remove(tier)
-            if tier in self.hidden_tiers:
-                self.hidden_tiers.remove(tier)
+        remove_tiers(self.collapsed_tiers, incomplete_tiers)
+        remove_tiers(self.hidden_tiers, incomplete_tiers)
         
         # Auto-collapse/hide newly completed tiers if in auto mode
         if self.auto_collapse_mode:
-            for tier in completed_tiers:
-                if tier not in self.collapsed_tiers:
-                    self.collapsed_tiers.append(tier)
+            add_tiers(self.collapsed_tiers, completed_tiers)
         
         if self.auto_hide_mode:
-            for tier in completed_tiers:
-                if tier not in self.hidden_tiers:
-                    self.hidden_tiers.append(tier)
+            add_tiers(self.hidden_tiers, completed_tiers)
     
     def _update_season_highest_rank(self, current_rank: ManualRank):
         """Update the highest rank achieved this season."""
@@ -124,10 +125,8 @@ class AppData:
             return False  # Non-mythic is never higher than mythic
         
         # Both are non-mythic - compare tier, division, and pips
-        tier_order = [RankTier.BRONZE, RankTier.SILVER, RankTier.GOLD, RankTier.PLATINUM, RankTier.DIAMOND]
-        
-        rank1_tier_idx = tier_order.index(rank1.tier)
-        rank2_tier_idx = tier_order.index(rank2.tier)
+        rank1_tier_idx = TIER_INDEX[rank1.tier]
+        rank2_tier_idx = TIER_INDEX[rank2.tier]
         
         if rank1_tier_idx > rank2_tier_idx:
             return True  # Higher tier
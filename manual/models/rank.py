@@ -4,9 +4,9 @@ Rank-related models for MTGA Manual TUI Tracker.
 Contains FormatType, RankTier enums and ManualRank class with all rank progression logic.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, List
+from typing import Dict, List, Optional
 from datetime import datetime
 
 
@@ -27,7 +27,56 @@ class RankTier(str, Enum):
     MYTHIC = "Mythic"
 
 
-@dataclass
+# Tiers in ladder order, lowest first, and the position of each
+TIER_ORDER = tuple(RankTier)
+TIER_ORDER_NO_MYTHIC = TIER_ORDER[:-1]
+TIER_INDEX = {tier: i for i, tier in enumerate(TIER_ORDER)}
+
+# Formats that share the constructed rank
+CONSTRUCTED_FORMATS = frozenset({FormatType.CONSTRUCTED_BO1, FormatType.CONSTRUCTED_BO3})
+
+# Hot-path enum members and tier groups, bound once - each RankTier.X lookup goes through the Enum metaclass
+_MYTHIC = RankTier.MYTHIC
+_BO3 = FormatType.CONSTRUCTED_BO3
+_NO_PIP_LOSS_TIERS = frozenset({RankTier.BRONZE, RankTier.SILVER})
+
+# Pips gained per win in BO1 and Limited - BO3 is double
+_BASE_PIPS_PER_WIN = {
+    RankTier.BRONZE: 2,
+    RankTier.SILVER: 2,
+    RankTier.GOLD: 2,
+    RankTier.PLATINUM: 1,
+    RankTier.DIAMOND: 1,
+    RankTier.MYTHIC: 1,
+}
+_PIPS_PER_WIN = {
+    (format_type, tier): pips * 2 if format_type == _BO3 else pips
+    for format_type in FormatType
+    for tier, pips in _BASE_PIPS_PER_WIN.items()
+}
+
+# Pips lost per loss - BO3 is double
+_PIPS_PER_LOSS = {
+    FormatType.CONSTRUCTED_BO1: 1,
+    FormatType.CONSTRUCTED_BO3: 2,
+    FormatType.LIMITED: 1,
+}
+
+# Pips per division for each format
+_LIMITED_MAX_PIPS = 4
+_MAX_PIPS = {
+    FormatType.CONSTRUCTED_BO1: 6,
+    FormatType.CONSTRUCTED_BO3: 6,
+    FormatType.LIMITED: _LIMITED_MAX_PIPS,
+}
+
+# Rank after one win or loss, keyed by (format_type, tier, division, pips) and filled in
+# as positions are reached - ranks are immutable, so the results can be shared
+_WIN_TABLE: Dict[tuple, 'ManualRank'] = {}
+_LOSS_TABLE: Dict[tuple, 'ManualRank'] = {}
+
+
+@dataclass(frozen=True, slots=True)
 class ManualRank:
     """Represents a player's rank in MTG Arena - standalone version."""
     tier: RankTier
@@ -36,47 +85,49 @@ class ManualRank:
     mythic_percentage: Optional[float] = None  # For Mythic only
     mythic_rank: Optional[int] = None  # Mythic rank number (#1234)
     format_type: FormatType = FormatType.CONSTRUCTED_BO1
+    _max_pips: int = field(init=False, repr=False, compare=False)
+    _is_mythic: bool = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Ranks are immutable, so the format's pip count and the Mythic check can be done once
+        object.__setattr__(self, '_max_pips', _MAX_PIPS.get(self.format_type, _LIMITED_MAX_PIPS))
+        object.__setattr__(self, '_is_mythic', self.tier == _MYTHIC)
     
     @property
     def max_pips(self) -> int:
         """Get max pips per division based on format."""
-        if self.format_type in [FormatType.CONSTRUCTED_BO1, FormatType.CONSTRUCTED_BO3]:
-            return 6
-        else:  # LIMITED
-            return 4
+        return self._max_pips
     
     def is_mythic(self) -> bool:
         """Check if rank is Mythic tier."""
-        return self.tier == RankTier.MYTHIC
+        return self._is_mythic
         
     def get_total_bars_remaining_to_mythic(self) -> int:
         """Calculate total bars needed to reach Mythic."""
-        if self.is_mythic():
+        if self._is_mythic:
             return 0
             
+        max_pips = self.max_pips
+        
         # Bars remaining in current division
-        bars_in_current = self.max_pips - self.pips
+        bars_in_current = max_pips - self.pips
         
         # Bars in divisions above current (within tier)
         bars_in_tier = 0
         if self.division and self.division > 1:
-            bars_in_tier = (self.division - 1) * self.max_pips
+            bars_in_tier = (self.division - 1) * max_pips
             
-        # Bars in tiers above current
-        tier_order = list(RankTier)[:-1]  # Exclude Mythic
-        current_tier_idx = tier_order.index(self.tier)
-        bars_in_higher_tiers = 0
-        
-        for tier_idx in range(current_tier_idx + 1, len(tier_order)):
-            bars_in_higher_tiers += 4 * self.max_pips  # 4 divisions per tier
+        # Bars in tiers above current - 4 divisions each, up to Diamond
+        tiers_above = TIER_INDEX[RankTier.DIAMOND] - TIER_INDEX[self.tier]
+        bars_in_higher_tiers = tiers_above * 4 * max_pips
             
         return bars_in_current + bars_in_tier + bars_in_higher_tiers
     
     def set_to_position(self, tier: RankTier, division: Optional[int], pips: int) -> 'ManualRank':
         """Set rank to specific position - returns new rank instance."""
-        if tier == RankTier.MYTHIC:
+        if tier == _MYTHIC:
             return ManualRank(
-                tier=RankTier.MYTHIC,
+                tier=_MYTHIC,
                 mythic_percentage=self.mythic_percentage or 50.0,
                 mythic_rank=self.mythic_rank,
                 format_type=self.format_type
@@ -91,49 +142,38 @@ class ManualRank:
     
     def add_win(self) -> 'ManualRank':
         """Add a win (pips based on tier and format)."""
-        if self.is_mythic():
+        if self._is_mythic:
             return self  # Mythic doesn't change pips
-            
+        
+        key = (self.format_type, self.tier, self.division, self.pips)
+        result = _WIN_TABLE.get(key)
+        if result is None:
+            result = _WIN_TABLE[key] = self._apply_win()
+        return result
+    
+    def _apply_win(self) -> 'ManualRank':
+        """Work out the rank after a win, for add_win to remember in _WIN_TABLE."""
         # Determine pips gained per win based on tier and format
-        if self.format_type == FormatType.CONSTRUCTED_BO3:
-            # BO3 is double the pips of BO1
-            if self.tier in [RankTier.BRONZE, RankTier.SILVER]:
-                pips_gained = 4  # Double of 2
-            elif self.tier == RankTier.GOLD:
-                pips_gained = 4  # Double of 2
-            elif self.tier in [RankTier.PLATINUM, RankTier.DIAMOND]:
-                pips_gained = 2  # Double of 1
-            else:
-                pips_gained = 2
-        else:
-            # BO1 or Limited - standard progression
-            if self.tier in [RankTier.BRONZE, RankTier.SILVER]:
-                pips_gained = 2
-            elif self.tier == RankTier.GOLD:
-                pips_gained = 2  
-            elif self.tier in [RankTier.PLATINUM, RankTier.DIAMOND]:
-                pips_gained = 1
-            else:
-                pips_gained = 1
-            
+        pips_gained = self.get_bars_per_win()
+        
         new_pips = self.pips + pips_gained
         new_division = self.division
         new_tier = self.tier
         
-        # Handle promotion within tier
-        while new_pips >= self.max_pips and new_division and new_division > 1:
-            new_pips -= self.max_pips
-            new_division -= 1
+        # Handle promotion within tier - every full division moves up one, stopping at Division 1
+        if new_division and new_division > 1:
+            promotions = min(new_pips // self.max_pips, new_division - 1)
+            new_pips -= promotions * self.max_pips
+            new_division -= promotions
         
         # Handle tier promotion
         if new_pips >= self.max_pips and new_division == 1:
-            tier_order = list(RankTier)
-            current_index = tier_order.index(self.tier)
-            if current_index < len(tier_order) - 1:
-                new_tier = tier_order[current_index + 1]
-                if new_tier == RankTier.MYTHIC:
+            current_index = TIER_INDEX[self.tier]
+            if current_index < len(TIER_ORDER) - 1:
+                new_tier = TIER_ORDER[current_index + 1]
+                if new_tier == _MYTHIC:
                     return ManualRank(
-                        tier=RankTier.MYTHIC,
+                        tier=_MYTHIC,
                         mythic_percentage=95.0,
                         format_type=self.format_type
                     )
@@ -150,39 +190,37 @@ class ManualRank:
     
     def add_loss(self) -> 'ManualRank':
         """Add a loss (pips lost based on tier)."""
-        if self.is_mythic():
+        if self._is_mythic:
             return self  # Mythic doesn't lose pips
             
         # Bronze/Silver can't lose pips at all
-        if self.tier in [RankTier.BRONZE, RankTier.SILVER]:
+        if self.tier in _NO_PIP_LOSS_TIERS:
             return self
-            
+        
+        key = (self.format_type, self.tier, self.division, self.pips)
+        result = _LOSS_TABLE.get(key)
+        if result is None:
+            result = _LOSS_TABLE[key] = self._apply_loss()
+        return result
+    
+    def _apply_loss(self) -> 'ManualRank':
+        """Work out the rank after a loss, for add_loss to remember in _LOSS_TABLE."""
         # Determine pips lost per loss based on format
-        if self.format_type == FormatType.CONSTRUCTED_BO3:
-            pips_lost = 2  # Double pip loss for BO3
-        else:
-            pips_lost = 1  # Standard pip loss for BO1/Limited
+        pips_lost = _PIPS_PER_LOSS.get(self.format_type, 1)
             
         new_pips = self.pips - pips_lost
         new_division = self.division
         new_tier = self.tier
         
         # Handle demotion if we go below 0 pips
-        if new_pips < 0 and new_division and new_division < 4:
-            # Move to next division down (higher number)
-            new_division += 1
-            new_pips = self.max_pips - 1
-        elif new_pips < 0 and new_division == 4:
-            # At bottom of tier, all tiers have tier floor protection
-            if self.tier in [RankTier.BRONZE, RankTier.SILVER, RankTier.GOLD, RankTier.PLATINUM, RankTier.DIAMOND]:
-                # All tiers have tier floor - can't drop to previous tier
-                new_pips = 0
+        if new_pips < 0:
+            if new_division and new_division < 4:
+                # Move to next division down (higher number)
+                new_division += 1
+                new_pips = self.max_pips - 1
             else:
-                # This shouldn't happen with current tier system
+                # At bottom of tier, all tiers have tier floor protection
                 new_pips = 0
-        elif new_pips < 0:
-            # Safety check
-            new_pips = 0
         
         return ManualRank(
             tier=new_tier,
@@ -193,26 +231,11 @@ class ManualRank:
     
     def get_bars_per_win(self) -> int:
         """Get the number of bars (pips) gained per win for this rank and format."""
-        if self.format_type == FormatType.CONSTRUCTED_BO3:
-            # BO3 is double the pips of BO1
-            if self.tier in [RankTier.BRONZE, RankTier.SILVER, RankTier.GOLD]:
-                return 4  # Double of 2
-            elif self.tier in [RankTier.PLATINUM, RankTier.DIAMOND]:
-                return 2  # Double of 1
-            else:
-                return 2
-        else:
-            # BO1 or Limited - standard progression
-            if self.tier in [RankTier.BRONZE, RankTier.SILVER, RankTier.GOLD]:
-                return 2
-            elif self.tier in [RankTier.PLATINUM, RankTier.DIAMOND]:
-                return 1
-            else:
-                return 1
+        return _PIPS_PER_WIN.get((self.format_type, self.tier), 1)
     
     def is_boss_fight(self) -> bool:
         """Check if the next win would promote to the next tier (boss fight!)."""
-        if self.is_mythic():
+        if self._is_mythic:
             return False  # Already at highest tier
         
         if self.division != 1:
@@ -226,21 +249,20 @@ class ManualRank:
     
     def next_tier(self) -> Optional[str]:
         """Get the name of the next tier for promotion."""
-        if self.is_mythic():
+        if self._is_mythic:
             return None
         
-        tier_order = list(RankTier)
-        current_index = tier_order.index(self.tier)
-        if current_index < len(tier_order) - 1:
-            next_tier_enum = tier_order[current_index + 1]
+        current_index = TIER_INDEX[self.tier]
+        if current_index < len(TIER_ORDER) - 1:
+            next_tier_enum = TIER_ORDER[current_index + 1]
             return next_tier_enum.value if hasattr(next_tier_enum, 'value') else str(next_tier_enum)
         return None
     
     def __str__(self) -> str:
         """String representation of rank."""
-        if self.is_mythic():
+        if self._is_mythic:
             if self.mythic_rank:
                 return f"Mythic #{self.mythic_rank}"
             return f"Mythic {self.mythic_percentage:.1f}%" if self.mythic_percentage else "Mythic"
         tier_name = self.tier.value if hasattr(self.tier, 'value') else self.tier
-        return f"{tier_name} {self.division} ({self.pips}/{self.max_pips})"
\ No newline at end of file
+        return f"{tier_name} {self.division} ({self.pips}/{self.max_pips})"
@@ -4,13 +4,22 @@ Session-related models for MTGA Manual TUI Tracker.
 Contains CompletedSession and SessionStats classes with all session tracking logic.
 """
 
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Optional, List, Tuple
-from .rank import ManualRank, RankTier, FormatType
+from typing import Deque, Optional, List, Tuple
+from .rank import ManualRank, RankTier, FormatType, TIER_INDEX
 
 
-@dataclass
+# Bars below the bottom of each tier, in RankTier order (24 per tier)
+_TIER_BASE_BARS = (0, 24, 48, 72, 96, 120)
+
+# How many completed sessions and game durations are kept
+SESSION_HISTORY_SIZE = 5
+GAME_DURATION_HISTORY_SIZE = 50
+
+
+@dataclass(slots=True)
 class CompletedSession:
     """A completed session record."""
     date: str  # YYYY-MM-DD format
@@ -24,7 +33,7 @@ class CompletedSession:
     bar_progress: int = 0  # Net bars gained/lost
 
 
-@dataclass  
+@dataclass(slots=True)
 class SessionStats:
     """Session and season statistics."""
     # Current session
@@ -50,13 +59,13 @@ class SessionStats:
     worst_loss_streak: int = 0
     
     # Session history (last 5 sessions)
-    session_history: List[CompletedSession] = None
+    session_history: Deque[CompletedSession] = field(default_factory=lambda: deque(maxlen=SESSION_HISTORY_SIZE))
     
     # Game notes for current session
-    game_notes: List[dict] = None
+    game_notes: List[dict] = field(default_factory=list)
     
     # Session game results (for L10 display)
-    session_game_results: List[str] = None
+    session_game_results: List[str] = field(default_factory=list)
     
     # Session timer controls
     session_paused: bool = False
@@ -64,7 +73,7 @@ class SessionStats:
     pause_start_time: Optional[datetime] = None
     game_start_time: Optional[datetime] = None
     game_paused_time: float = 0.0  # Total time paused during current game
-    game_durations: List[float] = None  # List of completed game durations in seconds
+    game_durations: Deque[float] = field(default_factory=lambda: deque(maxlen=GAME_DURATION_HISTORY_SIZE))  # List of completed game durations in seconds
     
     # Milestone tracking (to detect when thresholds are crossed)
     last_session_win_rate: float = 0.0
@@ -73,17 +82,6 @@ class SessionStats:
     # Paused time since last result (for active time calculation)
     paused_time_since_last_result: float = 0.0
     
-    def __post_init__(self):
-        """Initialize default values."""
-        if self.session_history is None:
-            self.session_history = []
-        if self.game_durations is None:
-            self.game_durations = []
-        if not hasattr(self, 'game_notes') or self.game_notes is None:
-            self.game_notes = []
-        if not hasattr(self, 'session_game_results') or self.session_game_results is None:
-            self.session_game_results = []
-    
     def get_session_win_rate(self) -> float:
         """Calculate session win rate."""
         total = self.session_wins + self.session_losses
@@ -98,63 +96,59 @@ class SessionStats:
             return 0.0
         return (self.season_wins / total) * 100
     
-    def add_win(self):
+    def add_win(self, now: Optional[datetime] = None):
         """Add a win to session and update streaks."""
         self.session_wins += 1
         self.season_wins += 1
         self.current_win_streak += 1
         self.current_loss_streak = 0
         self.best_win_streak = max(self.best_win_streak, self.current_win_streak)
-        self.last_result_time = datetime.now()
+        self.last_result_time = now or datetime.now()
         # Reset paused time counter for last result tracking
         self.paused_time_since_last_result = 0.0
         
         # Track all session game results
-        if not hasattr(self, 'session_game_results') or self.session_game_results is None:
-            self.session_game_results = []
         self.session_game_results.append('W')
         # Keep ALL results for the session (don't limit to 10)
     
-    def add_loss(self):
+    def add_loss(self, now: Optional[datetime] = None):
         """Add a loss to session and update streaks."""
         self.session_losses += 1
         self.season_losses += 1
         self.current_loss_streak += 1
         self.current_win_streak = 0
         self.worst_loss_streak = max(self.worst_loss_streak, self.current_loss_streak)
-        self.last_result_time = datetime.now()
+        self.last_result_time = now or datetime.now()
         # Reset paused time counter for last result tracking
         self.paused_time_since_last_result = 0.0
         
         # Track all session game results
-        if not hasattr(self, 'session_game_results') or self.session_game_results is None:
-            self.session_game_results = []
         self.session_game_results.append('L')
         # Keep ALL results for the session (don't limit to 10)
     
     def complete_current_session(self, current_rank: ManualRank, current_format: FormatType):
         """Complete the current session and add it to history."""
         if self.session_start_time and (self.session_wins > 0 or self.session_losses > 0):
+            now = datetime.now()
+            
             # Calculate bar progress
             bar_progress = self._calculate_bar_progress(self.session_start_rank, current_rank)
             
             # Create completed session record
             completed = CompletedSession(
-                date=datetime.now().strftime("%Y-%m-%d"),
+                date=now.strftime("%Y-%m-%d"),
                 wins=self.session_wins,
                 losses=self.session_losses,
                 start_time=self.session_start_time,
-                end_time=datetime.now(),
+                end_time=now,
                 start_rank=self.session_start_rank,
                 end_rank=current_rank,
                 format_type=current_format,
                 bar_progress=bar_progress
             )
             
-            # Add to history (keep only last 5)
+            # Add to history (the deque keeps only the last 5)
             self.session_history.append(completed)
-            if len(self.session_history) > 5:
-                self.session_history = self.session_history[-5:]
     
     def _calculate_bar_progress(self, start_rank: Optional[ManualRank], end_rank: ManualRank) -> int:
         """Calculate net bar progress between two ranks."""
@@ -172,13 +166,10 @@ class SessionStats:
     
     def _rank_to_total_bars(self, rank: ManualRank) -> int:
         """Convert rank to total bars for comparison."""
-        tier_values = {"Bronze": 0, "Silver": 24, "Gold": 48, "Platinum": 72, "Diamond": 96, "Mythic": 120}
-        tier_name = rank.tier.value if hasattr(rank.tier, 'value') else str(rank.tier)
-        
         if rank.is_mythic():
             return 120
         
-        base_bars = tier_values.get(tier_name, 0)
+        base_bars = _TIER_BASE_BARS[TIER_INDEX[rank.tier]]
         division_bars = (4 - rank.division) * 6  # Division 4=0 bars, 3=6 bars, 2=12 bars, 1=18 bars
         pip_bars = rank.pips
         
@@ -189,34 +180,34 @@ class SessionStats:
         self.game_start_time = datetime.now()
         self.game_paused_time = 0.0
     
-    def end_game_timer(self) -> float:
+    def end_game_timer(self, now: Optional[datetime] = None) -> float:
         """End the current game timer and return duration."""
         if not self.game_start_time:
             return 0.0
         
+        if now is None:
+            now = datetime.now()
         # Calculate total game duration excluding pauses
-        total_elapsed = (datetime.now() - self.game_start_time).total_seconds()
+        total_elapsed = (now - self.game_start_time).total_seconds()
         game_duration = total_elapsed - self.game_paused_time
         
-        # Record the duration
+        # Record the duration (the deque keeps only the last 50 for the average)
         self.game_durations.append(max(0, game_duration))
         
-        # Keep only last 50 games for average calculation
-        if len(self.game_durations) > 50:
-            self.game_durations = self.game_durations[-50:]
-        
         # Reset game timer
         self.game_start_time = None
         self.game_paused_time = 0.0
         
         return game_duration
     
-    def get_current_game_duration(self) -> float:
+    def get_current_game_duration(self, now: Optional[datetime] = None) -> float:
         """Get current game duration in seconds."""
         if not self.game_start_time:
             return 0.0
         
-        total_elapsed = (datetime.now() - self.game_start_time).total_seconds()
+        if now is None:
+            now = datetime.now()
+        total_elapsed = (now - self.game_start_time).total_seconds()
         return max(0, total_elapsed - self.game_paused_time)
     
     def get_average_game_duration(self) -> float:
@@ -259,13 +250,16 @@ class SessionStats:
             self.session_paused = False
             self.pause_start_time = None
     
-    def get_active_session_duration(self) -> timedelta:
+    def get_active_session_duration(self, now: Optional[datetime] = None) -> timedelta:
         """Get session duration excluding paused time."""
         if not self.session_start_time:
             return timedelta(0)
         
+        if now is None:
+            now = datetime.now()
+        
         # Calculate total elapsed time
-        total_elapsed = datetime.now() - self.session_start_time
+        total_elapsed = now - self.session_start_time
         
         # Subtract total paused time
         current_pause_time = 0
@@ -275,20 +269,23 @@ class SessionStats:
                     pause_start = datetime.fromisoformat(self.pause_start_time)
                 else:
                     pause_start = self.pause_start_time
-                current_pause_time = (datetime.now() - pause_start).total_seconds()
+                current_pause_time = (now - pause_start).total_seconds()
             except:
                 current_pause_time = 0
         
         active_seconds = total_elapsed.total_seconds() - self.total_paused_time - current_pause_time
         return timedelta(seconds=max(0, active_seconds))
     
-    def get_time_since_last_result(self) -> Tuple[int, int]:
+    def get_time_since_last_result(self, now: Optional[datetime] = None) -> Tuple[int, int]:
         """Get time since last result as (real_seconds, active_seconds)."""
         if not self.last_result_time:
             return (0, 0)
         
+        if now is None:
+            now = datetime.now()
+        
         # Real time (wall clock)
-        real_elapsed = (datetime.now() - self.last_result_time).total_seconds()
+        real_elapsed = (now - self.last_result_time).total_seconds()
         
         # Active time (excluding pauses)
         current_pause_time = 0
@@ -298,7 +295,7 @@ class SessionStats:
                     pause_start = datetime.fromisoformat(self.pause_start_time)
                 else:
                     pause_start = self.pause_start_time
-                current_pause_time = (datetime.now() - pause_start).total_seconds()
+                current_pause_time = (now - pause_start).total_seconds()
             except:
                 current_pause_time = 0
         
@@ -4,14 +4,40 @@ State manager for MTGA Manual TUI Tracker.
 Handles saving and loading application state to/from JSON files.
 """
 
-import json
 import os
+from collections import deque
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
-from dataclasses import asdict
+
+import orjson
 
 from models import FormatType, RankTier, ManualRank, CompletedSession, SessionStats, AppData
+from models.session import SESSION_HISTORY_SIZE, GAME_DURATION_HISTORY_SIZE
+
+
+# SessionStats fields saved as ISO strings
+_STATS_DATETIME_FIELDS = (
+    'session_start_time', 'season_end_date', 'last_result_time',
+    'pause_start_time', 'game_start_time'
+)
+
+# Saved enum values mapped back to the shared enum members
+_TIERS_BY_VALUE = {tier.value: tier for tier in RankTier}
+_FORMATS_BY_VALUE = {format_type.value: format_type for format_type in FormatType}
+
+
+def _iso(value):
+    """ISO string for a datetime; strings (not yet parsed after loading) and None pass through."""
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _rank_from_dict(data: dict) -> ManualRank:
+    """Rebuild a saved rank, with its tier and format as enum members rather than strings."""
+    data['tier'] = _TIERS_BY_VALUE.get(data['tier'], data['tier'])
+    if 'format_type' in data:
+        data['format_type'] = _FORMATS_BY_VALUE.get(data['format_type'], data['format_type'])
+    return ManualRank(**data)
 
 
 class StateManager:
@@ -19,6 +45,7 @@ class StateManager:
     
     def __init__(self, data_dir: Optional[Path] = None, save_enabled: bool = True):
         self.save_enabled = save_enabled
+        self._saved_bytes: Optional[bytes] = None  # What the state file holds, as last written
         
         if data_dir:
             self.data_dir = data_dir
@@ -40,47 +67,49 @@ class StateManager:
             return self._create_default_state()
         
         try:
-            with open(self.state_file, 'r') as f:
-                data = json.load(f)
+            data = orjson.loads(self.state_file.read_bytes())
             
             # Convert datetime strings back to objects
-            self._deserialize_datetimes(data)
+            self._deserialize_datetimes(data['stats'])
             self._deserialize_enums(data)
             
             # Migrate old format values to new BO1/BO3 system
             self._migrate_format_values(data)
             
             # Reconstruct objects
-            constructed_rank = ManualRank(**data['constructed_rank'])
-            limited_rank = ManualRank(**data['limited_rank'])
+            constructed_rank = _rank_from_dict(data['constructed_rank'])
+            limited_rank = _rank_from_dict(data['limited_rank'])
             
             # Handle SessionStats with potential missing fields
             stats_data = data['stats']
             
             # Reconstruct CompletedSession objects from session_history
-            if 'session_history' in stats_data and stats_data['session_history']:
-                session_history = []
-                for session_dict in stats_data['session_history']:
-                    session_history.append(CompletedSession(**session_dict))
-                stats_data['session_history'] = session_history
+            # (both histories are bounded deques rather than the saved lists)
+            if 'session_history' in stats_data:
+                stats_data['session_history'] = deque(
+                    (CompletedSession(**session_dict) for session_dict in stats_data['session_history'] or ()),
+                    maxlen=SESSION_HISTORY_SIZE)
+            if 'game_durations' in stats_data:
+                stats_data['game_durations'] = deque(stats_data['game_durations'] or (),
+                                                     maxlen=GAME_DURATION_HISTORY_SIZE)
             
             # Reconstruct ManualRank objects for season_start_rank and season_highest_rank
             if 'season_start_rank' in stats_data and isinstance(stats_data['season_start_rank'], dict):
-                stats_data['season_start_rank'] = ManualRank(**stats_data['season_start_rank'])
+                stats_data['season_start_rank'] = _rank_from_dict(stats_data['season_start_rank'])
             
             if 'season_highest_rank' in stats_data and isinstance(stats_data['season_highest_rank'], dict):
-                stats_data['season_highest_rank'] = ManualRank(**stats_data['season_highest_rank'])
+                stats_data['season_highest_rank'] = _rank_from_dict(stats_data['season_highest_rank'])
             
             stats = SessionStats(**stats_data)
             
             return AppData(
                 constructed_rank=constructed_rank,
                 limited_rank=limited_rank,
-                current_format=FormatType(data['current_format']),
+                current_format=_FORMATS_BY_VALUE[data['current_format']],
                 stats=stats,
                 show_mythic_progress=data.get('show_mythic_progress', True),
-                collapsed_tiers=[RankTier(t) for t in data.get('collapsed_tiers', [])],
-                hidden_tiers=[RankTier(t) for t in data.get('hidden_tiers', [])],
+                collapsed_tiers=[_TIERS_BY_VALUE[t] for t in data.get('collapsed_tiers', [])],
+                hidden_tiers=[_TIERS_BY_VALUE[t] for t in data.get('hidden_tiers', [])],
                 auto_collapse_mode=data.get('auto_collapse_mode', False),
                 auto_hide_mode=data.get('auto_hide_mode', False)
             )
@@ -97,27 +126,96 @@ class StateManager:
         try:
             # Convert to serializable format
             data = {
-                'constructed_rank': asdict(app_data.constructed_rank),
-                'limited_rank': asdict(app_data.limited_rank),
+                'constructed_rank': self._rank_to_dict(app_data.constructed_rank),
+                'limited_rank': self._rank_to_dict(app_data.limited_rank),
                 'current_format': app_data.current_format.value,
-                'stats': asdict(app_data.stats),
+                'stats': self._stats_to_dict(app_data.stats),
                 'show_mythic_progress': app_data.show_mythic_progress,
-                'collapsed_tiers': [t.value for t in app_data.collapsed_tiers],
-                'hidden_tiers': [t.value for t in app_data.hidden_tiers],
+                'collapsed_tiers': app_data.collapsed_tiers,  # orjson writes enum members as their value
+                'hidden_tiers': app_data.hidden_tiers,
                 'auto_collapse_mode': app_data.auto_collapse_mode,
                 'auto_hide_mode': app_data.auto_hide_mode
             }
             
-            # Serialize datetime objects
-            self._serialize_datetimes(data)
-            self._serialize_enums(data)
+            content = orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2)
+            if content == self._saved_bytes:
+                return  # Nothing changed since the last save
             
-            with open(self.state_file, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            # Write a sibling file and swap it in, so a crash mid-write can't truncate the state
+            tmp_file = self.state_file.with_suffix('.json.tmp')
+            try:
+                tmp_file.write_bytes(content)
+                os.replace(tmp_file, self.state_file)
+            except OSError:
+                tmp_file.unlink(missing_ok=True)  # Don't leave a half-written file behind
+                raise
+            self._saved_bytes = content
                 
         except Exception as e:
             print(f"Error saving state: {e}")
     
+    def _rank_to_dict(self, rank: Optional[ManualRank]) -> Optional[dict]:
+        """Convert a rank to a JSON-ready dict."""
+        if not isinstance(rank, ManualRank):
+            return rank  # None, or a dict that was never rebuilt after loading
+        # Tier and format are str enums (or plain strings when loaded), so they serialize as their value
+        return {
+            'tier': rank.tier,
+            'division': rank.division,
+            'pips': rank.pips,
+            'mythic_percentage': rank.mythic_percentage,
+            'mythic_rank': rank.mythic_rank,
+            'format_type': rank.format_type
+        }
+    
+    def _session_to_dict(self, session: CompletedSession) -> dict:
+        """Convert a completed session record to a JSON-ready dict."""
+        return {
+            'date': session.date,
+            'wins': session.wins,
+            'losses': session.losses,
+            'start_time': _iso(session.start_time),
+            'end_time': _iso(session.end_time),
+            'start_rank': self._rank_to_dict(session.start_rank),
+            'end_rank': self._rank_to_dict(session.end_rank),
+            'format_type': session.format_type,
+            'bar_progress': session.bar_progress
+        }
+    
+    def _stats_to_dict(self, stats: SessionStats) -> dict:
+        """Convert session stats to a JSON-ready dict."""
+        return {
+            'session_wins': stats.session_wins,
+            'session_losses': stats.session_losses,
+            'session_start_time': _iso(stats.session_start_time),
+            'session_start_rank': self._rank_to_dict(stats.session_start_rank),
+            'last_result_time': _iso(stats.last_result_time),
+            'session_goal_tier': stats.session_goal_tier,
+            'session_goal_division': stats.session_goal_division,
+            'season_wins': stats.season_wins,
+            'season_losses': stats.season_losses,
+            'season_start_rank': self._rank_to_dict(stats.season_start_rank),
+            'season_highest_rank': self._rank_to_dict(stats.season_highest_rank),
+            'season_end_date': _iso(stats.season_end_date),
+            'current_win_streak': stats.current_win_streak,
+            'current_loss_streak': stats.current_loss_streak,
+            'best_win_streak': stats.best_win_streak,
+            'worst_loss_streak': stats.worst_loss_streak,
+            'session_history': [self._session_to_dict(s) for s in stats.session_history],
+            'game_notes': [{**note, 'timestamp': _iso(note.get('timestamp'))} if 'timestamp' in note else note
+                           for note in stats.game_notes],
+            'session_game_results': stats.session_game_results,
+            'session_paused': stats.session_paused,
+            'total_paused_time': stats.total_paused_time,
+            'pause_start_time': _iso(stats.pause_start_time),
+            'game_start_time': _iso(stats.game_start_time),
+            'game_paused_time': stats.game_paused_time,
+            'game_durations': list(stats.game_durations),
+            'last_session_win_rate': stats.last_session_win_rate,
+            'last_season_win_rate': stats.last_season_win_rate,
+            'paused_time_since_last_result': stats.paused_time_since_last_result
+        }
+    
     def _create_default_state(self) -> AppData:
         """Create default application state."""
         default_date = datetime.now() + timedelta(days=30)  # 30 days from now
@@ -142,76 +240,30 @@ class StateManager:
             )
         )
     
-    def _serialize_datetimes(self, data: dict):
-        """Convert datetime objects to ISO strings for JSON serialization."""
-        def convert_datetime(obj):
-            if isinstance(obj, dict):
-                return {k: convert_datetime(v) for k, v in obj.items()}
-            elif isinstance(obj, datetime):
-                return obj.isoformat()
-            elif isinstance(obj, list):
-                return [convert_datetime(item) for item in obj]
-            else:
-                return obj
-        
-        # Update the data in place
-        for key, value in data.items():
-            data[key] = convert_datetime(value)
-    
-    def _serialize_enums(self, data: dict):
-        """Convert enum objects to string values for JSON serialization."""
-        def convert_enum(obj):
-            if isinstance(obj, dict):
-                return {k: convert_enum(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [convert_enum(item) for item in obj]
-            elif hasattr(obj, 'value'):  # It's an enum
-                return obj.value
-            else:
-                return obj
-        
-        # Update the data in place
-        for key, value in data.items():
-            data[key] = convert_enum(value)
-    
-    def _deserialize_datetimes(self, data: dict):
-        """Convert ISO strings back to datetime objects."""
-        datetime_fields = [
-            'session_start_time', 'season_end_date', 'last_result_time',
-            'pause_start_time', 'game_start_time',  # Timer datetime fields
-            'start_time', 'end_time',  # For CompletedSession objects
-            'timestamp'  # For game_notes timestamps
-        ]
-        
-        def convert_iso_string(obj, parent_key=""):
-            if isinstance(obj, dict):
-                for k, v in obj.items():
-                    obj[k] = convert_iso_string(v, k)
-                return obj
-            elif isinstance(obj, str) and parent_key in datetime_fields:
+    def _deserialize_datetimes(self, stats_data: dict):
+        """Convert the ISO strings of the saved stats datetime fields back to datetime objects."""
+        for key in _STATS_DATETIME_FIELDS:
+            value = stats_data.get(key)
+            if isinstance(value, str):
                 try:
-                    return datetime.fromisoformat(obj)
-                except:
-                    return None
-            return obj
-        
-        for key, value in data.items():
-            data[key] = convert_iso_string(value, key)
+                    stats_data[key] = datetime.fromisoformat(value)
+                except ValueError:
+                    stats_data[key] = None
     
     def _deserialize_enums(self, data: dict):
         """Convert string values back to enum objects."""
         # Handle session_goal_tier
         if 'session_goal_tier' in data and isinstance(data['session_goal_tier'], str):
             try:
-                data['session_goal_tier'] = RankTier(data['session_goal_tier'])
-            except (ValueError, TypeError):
+                data['session_goal_tier'] = _TIERS_BY_VALUE[data['session_goal_tier']]
+            except KeyError:
                 data['session_goal_tier'] = None
         
         # Handle current_format 
         if 'current_format' in data and isinstance(data['current_format'], str):
             try:
-                data['current_format'] = FormatType(data['current_format'])
-            except (ValueError, TypeError):
+                data['current_format'] = _FORMATS_BY_VALUE[data['current_format']]
+            except KeyError:
                 data['current_format'] = FormatType.CONSTRUCTED_BO1
     
     def _migrate_format_values(self, data):
@@ -43,6 +43,7 @@ class TrackingConfig(BaseModel):
     track_deck_names: bool = Field(True, description="Track player and opponent deck names")
     track_notes: bool = Field(True, description="Enable note-taking for games")
     auto_detect_decks: bool = Field(True, description="Auto-detect deck types from logs")
+    auto_save: bool = Field(True, description="Save session state automatically")
     common_decks: List[str] = Field(
         default_factory=lambda: [
             "Mono-Red Aggro", "Esper Control", "Grixis Midrange", 
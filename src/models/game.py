@@ -6,7 +6,7 @@ from enum import Enum
 from typing import Optional
 from pydantic import BaseModel, Field
 
-from .rank import FormatType, Rank
+from .rank import FormatType, Rank, TIER_INDEX
 
 
 class GameResult(str, Enum):
@@ -57,9 +57,8 @@ class Game(BaseModel):
             return False
         
         # Check tier promotion
-        tier_order = ["Bronze", "Silver", "Gold", "Platinum", "Diamond", "Mythic"]
-        before_idx = tier_order.index(self.rank_before.tier.value)
-        after_idx = tier_order.index(self.rank_after.tier.value)
+        before_idx = TIER_INDEX[self.rank_before.tier]
+        after_idx = TIER_INDEX[self.rank_after.tier]
         
         if after_idx > before_idx:
             return True
@@ -78,9 +77,8 @@ class Game(BaseModel):
             return False
         
         # Check tier demotion
-        tier_order = ["Bronze", "Silver", "Gold", "Platinum", "Diamond", "Mythic"]
-        before_idx = tier_order.index(self.rank_before.tier.value)
-        after_idx = tier_order.index(self.rank_after.tier.value)
+        before_idx = TIER_INDEX[self.rank_before.tier]
+        after_idx = TIER_INDEX[self.rank_after.tier]
         
         if after_idx < before_idx:
             return True
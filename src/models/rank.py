@@ -22,6 +22,11 @@ class FormatType(str, Enum):
     LIMITED = "Limited"
 
 
+# Tiers in ladder order, lowest first, and the position of each
+TIER_ORDER = tuple(RankTier)
+TIER_INDEX = {tier: i for i, tier in enumerate(TIER_ORDER)}
+
+
 class Rank(BaseModel):
     """Represents a player's rank in MTG Arena."""
     tier: RankTier
@@ -82,17 +87,17 @@ class Rank(BaseModel):
         new_tier = self.tier
         new_losses_at_zero = 0  # Reset losses counter on any gain
         
-        # Handle promotion within tier
-        while new_pips >= self.max_pips and new_division > 1:
-            new_pips -= self.max_pips
-            new_division -= 1
+        # Handle promotion within tier - every full division moves up one, stopping at Division 1
+        if new_pips >= self.max_pips and new_division > 1:
+            promotions = min(new_pips // self.max_pips, new_division - 1)
+            new_pips -= promotions * self.max_pips
+            new_division -= promotions
         
         # Handle tier promotion
         if new_pips >= self.max_pips and new_division == 1:
-            tier_order = list(RankTier)
-            current_index = tier_order.index(self.tier)
-            if current_index < len(tier_order) - 1:
-                new_tier = tier_order[current_index + 1]
+            current_index = TIER_INDEX[self.tier]
+            if current_index < len(TIER_ORDER) - 1:
+                new_tier = TIER_ORDER[current_index + 1]
                 if new_tier == RankTier.MYTHIC:
                     # Promote to Mythic
                     return Rank(
@@ -172,10 +177,9 @@ class Rank(BaseModel):
         if self.tier == RankTier.MYTHIC:
             return None
         
-        tier_order = list(RankTier)
-        current_index = tier_order.index(self.tier)
-        if current_index < len(tier_order) - 1:
-            return tier_order[current_index + 1].value
+        current_index = TIER_INDEX[self.tier]
+        if current_index < len(TIER_ORDER) - 1:
+            return TIER_ORDER[current_index + 1].value
         return None
     
     def __str__(self) -> str:
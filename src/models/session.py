@@ -73,12 +73,31 @@ class Session(BaseModel):
         if self.status == SessionStatus.PAUSED:
             self.status = SessionStatus.ACTIVE
     
-    def get_duration_minutes(self) -> int:
-        """Get session duration in minutes."""
-        end = self.end_time or datetime.now()
+    def get_duration_minutes(self, now: Optional[datetime] = None) -> int:
+        """Get session duration in minutes.
+        
+        now is the time to measure a running session up to, so callers that
+        need several time-based values can read the clock once.
+        """
+        end = self.end_time or now or datetime.now()
         delta = end - self.start_time
         return int(delta.total_seconds() / 60)
     
+    def get_session_duration(self, now: Optional[datetime] = None) -> str:
+        """Get session duration formatted as hours and minutes."""
+        hours, minutes = divmod(self.get_duration_minutes(now), 60)
+        return f"{hours}h {minutes:02d}m"
+    
+    def get_statistics(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Get summary statistics for display."""
+        minutes = self.get_duration_minutes(now)
+        return {
+            'wins': self.stats.wins,
+            'losses': self.stats.losses,
+            'win_rate': self.stats.win_rate(),
+            'games_per_hour': self.stats.total_games * 60 / minutes if minutes else 0.0,
+        }
+    
     def get_rank_change(self) -> str:
         """Get a string representation of rank change during session."""
         if self.starting_rank.tier != self.current_rank.tier:
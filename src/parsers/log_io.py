@@ -0,0 +1,200 @@
+"""
+Low-level helpers for reading large MTGA log files.
+"""
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+
+
+# Below this size a worker pool costs more to start than it saves
+PARALLEL_THRESHOLD = 32 * 1024 * 1024
+
+# Bytes read per block when scanning for matching lines
+SCAN_BLOCK_SIZE = 8 * 1024 * 1024
+
+# Bump when the layout of cached parse results changes
+INDEX_VERSION = 6
+# Bytes just before the cached offset used to detect a rewritten log
+FINGERPRINT_SIZE = 4096
+
+
+def split_line_ranges(log_file: Path, parts: int, start: int = 0,
+                      end: Optional[int] = None) -> List[Tuple[int, int]]:
+    """Split a byte range of a file into ranges that each start at the beginning of a line.
+
+    start must itself be the beginning of a line.
+    """
+    if end is None:
+        end = os.path.getsize(log_file)
+    if start >= end:
+        return []
+
+    boundaries = [start]
+    with open(log_file, 'rb') as f:
+        for i in range(1, parts):
+            f.seek(max(start + (end - start) * i // parts, boundaries[-1]))
+            f.readline()  # Move forward to the next line start
+            boundaries.append(min(f.tell(), end))
+    boundaries.append(end)
+
+    return [(a, b) for a, b in zip(boundaries, boundaries[1:]) if a < b]
+
+
+def usable_cpu_count() -> int:
+    """Number of CPUs this process may run on."""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def should_parallelize(num_bytes: int) -> bool:
+    """Check whether a byte range is large enough to be worth parsing in parallel."""
+    return usable_cpu_count() > 1 and num_bytes >= PARALLEL_THRESHOLD
+
+
+def find_matching_lines(log_file: Path, pattern: Pattern[bytes], start: int = 0,
+                        end: Optional[int] = None,
+                        ignore_case: bool = False) -> Tuple[List[Tuple[int, bytes]], int]:
+    """Find the lines in a byte range that contain a match for pattern.
+
+    The file is read in large blocks and the regex runs over each whole block,
+    so lines without a match are skipped and counted entirely in C. Returns
+    (line_number, line) pairs and the number of lines scanned; line numbers
+    count from 1 at start, which must be the beginning of a line.
+
+    With ignore_case the block is lowercased before searching, so pattern
+    must be written in lowercase. This is several times faster than a (?i)
+    pattern with many alternatives.
+    """
+    if end is None:
+        end = os.path.getsize(log_file)
+
+    matches = []
+    line_num = 0
+    with open(log_file, 'rb') as f:
+        # Single sequential pass - let the kernel read ahead aggressively
+        prefetch = hasattr(os, 'posix_fadvise')
+        if prefetch:
+            os.posix_fadvise(f.fileno(), start, end - start, os.POSIX_FADV_SEQUENTIAL)
+        f.seek(start)
+        pos = start
+        ends_with_newline = True
+        while pos < end:
+            block = f.read(min(SCAN_BLOCK_SIZE, end - pos))
+            if not block:
+                break
+            # Finish the current line so no line straddles two blocks
+            if pos + len(block) < end and not block.endswith(b'\n'):
+                block += f.readline()
+
+            # Start the disk read of the next block while this one is searched
+            next_pos = pos + len(block)
+            if prefetch and next_pos < end:
+                os.posix_fadvise(f.fileno(), next_pos, min(SCAN_BLOCK_SIZE, end - next_pos),
+                                 os.POSIX_FADV_WILLNEED)
+
+            haystack = block.lower() if ignore_case else block
+            counted = 0  # Newlines before this offset are already in line_num
+            match = pattern.search(haystack)
+            while match:
+                line_start = block.rfind(b'\n', 0, match.start()) + 1
+                line_end = block.find(b'\n', match.end())
+                if line_end == -1:
+                    line_end = len(block)
+                line_num += block.count(b'\n', counted, line_start)
+                counted = line_start
+                matches.append((line_num + 1, block[line_start:line_end]))
+                match = pattern.search(haystack, line_end + 1)
+
+            line_num += block.count(b'\n', counted)
+            ends_with_newline = block.endswith(b'\n')
+            pos += len(block)
+
+        # A final line without a trailing newline still counts
+        if not ends_with_newline:
+            line_num += 1
+
+    return matches, line_num
+
+
+def last_line_end(log_file: Path, size: int) -> int:
+    """Offset just past the last newline in the first size bytes of a file.
+
+    MTGA may be mid-way through writing the final line, so only data up to
+    this point is safe to cache.
+    """
+    block = 64 * 1024
+    with open(log_file, 'rb') as f:
+        pos = size
+        while pos > 0:
+            read_from = max(0, pos - block)
+            f.seek(read_from)
+            nl = f.read(pos - read_from).rfind(b'\n')
+            if nl != -1:
+                return read_from + nl + 1
+            pos = read_from
+    return 0
+
+
+def index_path(log_file: Path, name: str) -> Path:
+    """Sidecar file holding a cached parse of log_file."""
+    return log_file.with_name(f"{log_file.name}.{name}.idx")
+
+
+def _fingerprint(log_file: Path, offset: int) -> bytes:
+    """Bytes immediately before offset, used to verify the cached prefix."""
+    with open(log_file, 'rb') as f:
+        f.seek(max(0, offset - FINGERPRINT_SIZE))
+        return f.read(min(offset, FINGERPRINT_SIZE))
+
+
+def load_index(log_file: Path, name: str) -> Optional[Dict[str, Any]]:
+    """Load a cached parse of log_file if the file still starts with the cached data.
+
+    Returns a dict with 'offset' (bytes parsed), 'lines' (lines parsed) and
+    'events', or None when there is no usable cache.
+    """
+    try:
+        with open(index_path(log_file, name), 'rb') as f:
+            index = pickle.load(f)
+        stat = log_file.stat()
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return None
+
+    if not isinstance(index, dict) or index.get('version') != INDEX_VERSION:
+        return None
+
+    # A new inode, a shorter file or different bytes mean MTGA started a fresh log
+    if index['inode'] != stat.st_ino or index['offset'] > stat.st_size:
+        return None
+    try:
+        if _fingerprint(log_file, index['offset']) != index['fingerprint']:
+            return None
+    except OSError:
+        return None
+
+    return index
+
+
+def save_index(log_file: Path, name: str, offset: int, lines: int, events: Any) -> None:
+    """Cache the parse of the first offset bytes of log_file.
+
+    Failures are ignored - the cache is only an optimisation.
+    """
+    path = index_path(log_file, name)
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        index = {
+            'version': INDEX_VERSION,
+            'inode': log_file.stat().st_ino,
+            'offset': offset,
+            'lines': lines,
+            'fingerprint': _fingerprint(log_file, offset),
+            'events': events,
+        }
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Test script for following a growing MTGA log with MTGALogParser.feed().
+"""
+import json
+
+from textual_log_viewer import MTGALogParser
+
+
+GAME_STATE_LINE = json.dumps({
+    "greToClientEvent": {"greToClientMessages": [{
+        "type": "GREMessageType_GameStateMessage",
+        "gameStateMessage": {
+            "gameInfo": {"stage": "GameStage_Play", "matchState": "MatchState_GameInProgress"},
+            "players": [{"systemSeatNumber": 1, "lifeTotal": 17}, {"systemSeatNumber": 2, "lifeTotal": 12}]
+        }
+    }]}
+}).encode()
+
+
+def test_split_line():
+    """Test a line that arrives in two chunks is parsed once, whole."""
+    print("=== Testing Line Split Across Chunks ===")
+
+    parser = MTGALogParser()
+    middle = len(GAME_STATE_LINE) // 2
+
+    first = parser.feed(b"Match won\n" + GAME_STATE_LINE[:middle])
+    assert [e.event_type for e in first] == ["LineResult_Win"], "❌ Partial line should be held back"
+    print("✅ Partial line held back until the rest arrives")
+
+    second = parser.feed(GAME_STATE_LINE[middle:] + b"\n")
+    assert len(second) == 1, "❌ Completed line should give exactly one event"
+    event = second[0]
+    assert event.event_type == "GRE_GREMessageType_GameStateMessage", f"❌ Wrong event type {event.event_type}"
+    assert "P1:17♥ vs P2:12♥" in event.content, f"❌ Line was not parsed whole: {event.content}"
+    assert event.line_num == 2, f"❌ Expected line 2, got {event.line_num}"
+    print(f"✅ Joined line parsed as {event.event_type} on line {event.line_num}")
+
+    print()
+
+
+def test_reset_after_truncation():
+    """Test reset_feed drops the partial line and restarts line numbers."""
+    print("=== Testing Reset After Truncation ===")
+
+    parser = MTGALogParser()
+    parser.feed(b"Match won\nMatch lost\n" + GAME_STATE_LINE[:20])
+
+    # MTGA truncated or replaced the log - the new file starts from scratch
+    parser.reset_feed()
+    events = parser.feed(b"Match lost\n")
+
+    assert len(events) == 1, "❌ Stale partial line leaked into the new log"
+    assert events[0].event_type == "LineResult_Loss", f"❌ Wrong event type {events[0].event_type}"
+    assert events[0].line_num == 1, f"❌ Line numbers should restart, got {events[0].line_num}"
+    print("✅ Partial line discarded and line numbers restarted")
+
+    print()
+
+
+def main():
+    """Run all log feed tests."""
+    print("MTG Arena Tracker - Log Feed Testing")
+    print("=" * 40)
+
+    try:
+        test_split_line()
+        test_reset_after_truncation()
+
+        print("✅ All log feed tests completed successfully!")
+
+    except AssertionError as e:
+        print(f"{e}")
+    except Exception as e:
+        print(f"❌ Log feed test failed: {e}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Test script for the block scanner and parse cache in src.parsers.log_io.
+"""
+import re
+import tempfile
+from pathlib import Path
+
+from src.parsers import log_io
+from src.parsers.log_io import find_matching_lines, last_line_end, load_index, save_index
+
+
+RANK_PATTERN = re.compile(rb'rank')
+
+
+def write_log(directory: str, data: bytes) -> Path:
+    """Write a fake Player.log and return its path."""
+    log_file = Path(directory) / "Player.log"
+    log_file.write_bytes(data)
+    return log_file
+
+
+def test_line_numbering():
+    """Test line numbers and counts with and without a trailing newline."""
+    print("=== Testing Line Numbering ===")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        log_file = write_log(temp_dir, b"noise\nrank one\nnoise\nrank two\n")
+        matches, lines = find_matching_lines(log_file, RANK_PATTERN)
+        assert matches == [(2, b"rank one"), (4, b"rank two")], f"❌ Wrong matches: {matches}"
+        assert lines == 4, f"❌ Expected 4 lines, got {lines}"
+        print("✅ Lines numbered from 1 with a trailing newline")
+
+        log_file = write_log(temp_dir, b"noise\nrank one\nnoise\nrank two")
+        matches, lines = find_matching_lines(log_file, RANK_PATTERN)
+        assert matches == [(2, b"rank one"), (4, b"rank two")], f"❌ Wrong matches: {matches}"
+        assert lines == 4, f"❌ A final line without a newline should count, got {lines}"
+        print("✅ Final line without a newline still matched and counted")
+
+    print()
+
+
+def test_line_across_blocks():
+    """Test a line that straddles the scan block boundary is read whole."""
+    print("=== Testing Line Across Scan Blocks ===")
+
+    block_size = log_io.SCAN_BLOCK_SIZE
+    log_io.SCAN_BLOCK_SIZE = 16
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # The match starts before byte 16 and ends after it
+            log_file = write_log(temp_dir, b"noise noise\nthe rank line spans blocks\nrank\nx\n")
+            matches, lines = find_matching_lines(log_file, RANK_PATTERN)
+    finally:
+        log_io.SCAN_BLOCK_SIZE = block_size
+
+    assert matches == [(2, b"the rank line spans blocks"), (3, b"rank")], f"❌ Wrong matches: {matches}"
+    assert lines == 4, f"❌ Expected 4 lines, got {lines}"
+    print("✅ Straddling line matched once, whole, with the right line number")
+
+    print()
+
+
+def test_cache_invalidation():
+    """Test the cache is dropped when the log is truncated or rewritten."""
+    print("=== Testing Cache Invalidation ===")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data = b"rank one\nnoise\n" * 10
+        log_file = write_log(temp_dir, data)
+        save_index(log_file, 'test', len(data), 20, ['event'])
+        assert load_index(log_file, 'test') is not None, "❌ Fresh cache should load"
+        print("✅ Cache loads for an unchanged log")
+
+        # Truncated: shorter than the cached offset
+        with open(log_file, 'wb') as f:
+            f.write(b"rank one\n")
+        assert load_index(log_file, 'test') is None, "❌ Cache used for a truncated log"
+        print("✅ Cache dropped for a truncated log")
+
+        # Rewritten in place: same inode and size, different bytes
+        save_index(log_file, 'test', 9, 1, ['event'])
+        with open(log_file, 'wb') as f:
+            f.write(b"noise 1\n\n")
+        assert load_index(log_file, 'test') is None, "❌ Cache used for a rewritten log"
+        print("✅ Cache dropped for a rewritten log")
+
+    print()
+
+
+def test_append_from_cached_offset():
+    """Test only data appended after the cached offset needs scanning."""
+    print("=== Testing Append From Cached Offset ===")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        log_file = write_log(temp_dir, b"rank one\nnoise\n")
+        size = log_file.stat().st_size
+        matches, lines = find_matching_lines(log_file, RANK_PATTERN)
+        save_index(log_file, 'test', last_line_end(log_file, size), lines, matches)
+
+        with open(log_file, 'ab') as f:
+            f.write(b"noise\nrank two\npartial ra")
+
+        index = load_index(log_file, 'test')
+        assert index is not None, "❌ Cache should survive an append"
+        assert index['offset'] == size and index['lines'] == 2, f"❌ Wrong cached position: {index}"
+        print("✅ Cache still valid after MTGA appends to the log")
+
+        end = last_line_end(log_file, log_file.stat().st_size)
+        new_matches, new_lines = find_matching_lines(log_file, RANK_PATTERN, index['offset'], end)
+        assert new_matches == [(2, b"rank two")], f"❌ Wrong new matches: {new_matches}"
+        assert new_lines == 2, f"❌ Expected 2 new complete lines, got {new_lines}"
+        # Line numbers in the new range continue from the cached count
+        assert index['lines'] + new_matches[0][0] == 4, "❌ Line number should continue from the cache"
+        print("✅ Only the appended complete lines were scanned")
+
+    print()
+
+
+def main():
+    """Run all log I/O tests."""
+    print("MTG Arena Tracker - Log I/O Testing")
+    print("=" * 40)
+
+    try:
+        test_line_numbering()
+        test_line_across_blocks()
+        test_cache_invalidation()
+        test_append_from_cached_offset()
+
+        print("✅ All log I/O tests completed successfully!")
+
+    except AssertionError as e:
+        print(f"{e}")
+    except Exception as e:
+        print(f"❌ Log I/O test failed: {e}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
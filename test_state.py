@@ -121,6 +121,37 @@ def test_session_lifecycle():
     print()
 
 
+def test_session_timing():
+    """Test duration and pace figures measured up to a given time."""
+    print("=== Testing Session Timing ===")
+    
+    rank = Rank(tier=RankTier.GOLD, division=2, pips=1)
+    session = Session(
+        session_id="timing",
+        format_type=FormatType.CONSTRUCTED,
+        starting_rank=rank,
+        current_rank=rank,
+        start_time=datetime(2025, 1, 1, 10, 0)
+    )
+    for result in (GameResult.WIN, GameResult.WIN, GameResult.LOSS):
+        session.add_game(Game(result=result, play_order=PlayOrder.PLAY, format_type=FormatType.CONSTRUCTED))
+    
+    now = datetime(2025, 1, 1, 11, 30)
+    duration = session.get_session_duration(now)
+    stats = session.get_statistics(now)
+    assert duration == "1h 30m", f"❌ Wrong duration text: {duration}"
+    assert stats['games_per_hour'] == 2.0, f"❌ Wrong games per hour: {stats['games_per_hour']}"
+    print(f"✅ Duration text: {duration}")
+    print(f"✅ Games/hour: {stats['games_per_hour']:.1f}")
+    
+    # No time has passed yet - no pace rather than a division by zero
+    stats = session.get_statistics(session.start_time)
+    assert stats['games_per_hour'] == 0.0, f"❌ Expected 0 games per hour, got {stats['games_per_hour']}"
+    print("✅ Games/hour is 0 for a session that has just started")
+    
+    print()
+
+
 def test_live_game_state():
     """Test live game state tracking."""
     print("=== Testing Live Game State ===")
@@ -209,6 +240,7 @@ def main():
         test_basic_state_operations()
         test_game_tracking()
         test_session_lifecycle()
+        test_session_timing()
         test_live_game_state()
         test_persistence()
         
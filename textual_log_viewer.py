@@ -53,6 +53,9 @@ class MTGALogParser:
             'event_types': {},
             'errors': []
         }
+        # Partial last line and line count for data passed to feed()
+        self._pending = b''
+        self._fed_lines = 0
         
     def parse_file(self, log_file: Path) -> List[LogEvent]:
         """Parse MTGA log file with enhanced understanding."""
@@ -98,6 +101,34 @@ class MTGALogParser:
         self.events = events
         return events
     
+    def feed(self, data: bytes) -> List[LogEvent]:
+        """Parse newly appended log data, for following a log as it is written.
+        
+        A trailing partial line is held back until the rest of it arrives.
+        Line numbers count from the first data fed in.
+        """
+        lines = (self._pending + data).split(b'\n')
+        self._pending = lines.pop()
+        
+        events = []
+        for raw in lines:
+            self._fed_lines += 1
+            line = raw.decode('utf-8', errors='ignore').strip()
+            if not line:
+                continue
+            try:
+                event = self._parse_line(line, self._fed_lines)
+            except Exception:
+                continue
+            if event:
+                events.append(event)
+        return events
+    
+    def reset_feed(self) -> None:
+        """Forget any partial line, e.g. when MTGA starts a new log file."""
+        self._pending = b''
+        self._fed_lines = 0
+    
     def _parse_line(self, line: str, line_num: int) -> Optional[LogEvent]:
         """Parse a single log line with enhanced logic."""
         timestamp = datetime.now()